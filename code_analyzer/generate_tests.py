@@ -15,6 +15,8 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import asyncio
+import hashlib
 import json
 import os
 import re
@@ -22,6 +24,41 @@ import sys
 import time
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+def _dumps(obj, indent: int = 2) -> str:
+    """Serialize to JSON, using orjson's C encoder when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+    return json.dumps(obj, indent=indent, default=str, ensure_ascii=False)
+
+
+def _loads(text: str):
+    """Parse JSON with orjson, falling back to the stdlib for NaN/Infinity literals."""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+_FENCED_JSON_RE = re.compile(r"```json\s*\n(.*?)\n```", re.DOTALL)
+
+
+_ENV_KEY_RE = re.compile(r"^[ \t]*GEMINI_API_KEY=(.*)$", re.MULTILINE)
+
 
 def load_api_key() -> str:
     key = os.environ.get("GEMINI_API_KEY")
@@ -29,25 +66,80 @@ def load_api_key() -> str:
         return key
     env_path = Path(__file__).parent / ".env"
     if env_path.exists():
-        for line in env_path.read_text().splitlines():
-            line = line.strip()
-            if line.startswith("GEMINI_API_KEY="):
-                return line.split("=", 1)[1].strip().strip("'\"")
+        m = _ENV_KEY_RE.search(env_path.read_text())
+        if m:
+            return m.group(1).strip().strip("'\"")
     print("Error: GEMINI_API_KEY not found.", file=sys.stderr)
     sys.exit(1)
 
 
 def run_analysis(repo_path: str, report_path: str) -> dict:
     from code_analyzer import analyze_repo
+
     print(f"[1/3] Analyzing {repo_path}...", file=sys.stderr)
     return analyze_repo(repo_path, output_path=report_path, parallel=False)
 
 
+# Roughly 60% of the Gemini 3 context window, leaving room for thinking + output.
+MAX_PROMPT_TOKENS = 600_000
+_BATCH_SEPARATOR = "\n\n<!-- next batch -->\n\n"
+GEMINI_CONCURRENCY = 8
+CACHE_PATH = Path.home() / ".cache" / "ai_base" / "test_cases_cache.json"
+
+
+def _render_report(report: dict) -> str:
+    report_json = _dumps(report, indent=1)
+    return f"# Analysis Report\n\n```json\n{report_json}\n```"
+
+
+def _render_prompt(template: str, report_block: str) -> str:
+    return f"{template}\n\n---\n\n{report_block}"
+
+
 def build_prompt(report: dict, prompt_template_path: str) -> str:
     template = Path(prompt_template_path).read_text(encoding="utf-8")
-    trimmed = trim_report(report)
-    report_json = json.dumps(trimmed, indent=1, default=str)
-    return f"{template}\n\n---\n\n# Analysis Report\n\n```json\n{report_json}\n```"
+    return _render_prompt(template, _render_report(trim_report(report)))
+
+
+def build_prompts(
+    trimmed: dict, prompt_template_path: str, max_tokens: int = MAX_PROMPT_TOKENS
+) -> tuple[str, list[str]]:
+    """Split a trimmed report into module batches, packing as many modules per call as fit.
+
+    Returns the static template and one report block per batch. Small repos produce
+    a single block; large ones are split so each call stays within ``max_tokens``.
+    """
+    template = Path(prompt_template_path).read_text(encoding="utf-8")
+    trimmed = dict(trimmed)
+    modules = trimmed.pop("modules", [])
+    budget = max_tokens - _est_tokens(template) - _est_tokens(_dumps(trimmed, indent=1))
+
+    batches: list[list[dict]] = []
+    current: list[dict] = []
+    used = 0
+    for mod in modules:
+        cost = _est_tokens(_dumps(mod, indent=1))
+        if current and used + cost > budget:
+            batches.append(current)
+            current, used = [], 0
+        current.append(mod)
+        used += cost
+    if current or not batches:
+        batches.append(current)
+
+    return template, [
+        _render_report({**trimmed, "modules": batch}) for batch in batches
+    ]
+
+
+def _est_tokens(text: str) -> int:
+    """Cheap token estimate (~4 chars per token), good enough for budgeting."""
+    return len(text) >> 2
+
+
+def _compact(source: str) -> str:
+    """Drop blank lines and trailing whitespace; indentation is kept for structure."""
+    return "\n".join(line.rstrip() for line in source.splitlines() if line.strip())
 
 
 def _trim_func(func: dict) -> None:
@@ -55,11 +147,19 @@ def _trim_func(func: dict) -> None:
     cc = func.get("complexity", {}).get("cyclomatic", 0)
 
     source = func.get("source", "")
-    lines = source.splitlines()
-    if cc <= 1 and len(lines) > 5:
-        func["source"] = "\n".join(lines[:3]) + f"\n    # ... ({len(lines)} lines)"
-    elif cc <= 3 and len(lines) > 15:
-        func["source"] = "\n".join(lines[:10]) + f"\n    # ... ({len(lines)} lines)"
+    if source:
+        source = func["source"] = _compact(source)
+    budget = 40 if cc <= 1 else 200 if cc <= 3 else 600
+    total = _est_tokens(source)
+    if total > budget:
+        # Cut on a line boundary so the kept prefix stays readable.
+        head = source[: budget << 2]
+        nl = head.rfind("\n")
+        if nl > 0:
+            head = head[:nl]
+        func["source"] = (
+            f"{head}\n    # ... ({total - _est_tokens(head)} tokens elided)"
+        )
 
     edges = func.get("edge_cases", [])
     if edges:
@@ -74,59 +174,207 @@ def _trim_func(func: dict) -> None:
                 break
         func["edge_cases"] = kept
 
+    # The parsed docstring fields carry everything the prompt uses; the raw text
+    # and empty collections are dead weight in the payload.
     doc = func.get("docstring", {})
-    if isinstance(doc, dict) and doc.get("summary"):
+    if isinstance(doc, dict):
         doc.pop("raw", None)
+        doc.pop("raw_lines", None)
+    for key in ("decorators", "nested_functions"):
+        if not func.get(key):
+            func.pop(key, None)
 
+    # Keep first-seen order: a set would reorder calls between runs (str hash
+    # randomization) and defeat the batch cache keyed on the rendered report.
     calls = func.get("data_flow", {}).get("calls_made", [])
-    if calls:
-        func["data_flow"]["calls_made"] = list(dict.fromkeys(calls))
+    if len(calls) > 1:
+        unique = set(calls)
+        if len(unique) != len(calls):
+            func["data_flow"]["calls_made"] = list(dict.fromkeys(calls))
+
+
+def _trim_module(mod: dict) -> bool:
+    """Trim a single module dict in-place. Returns False if it has nothing to test."""
+    if (
+        not mod.get("functions")
+        and not mod.get("classes")
+        and not mod.get("module_variables")
+    ):
+        return False
+
+    for func in mod.get("functions", []):
+        _trim_func(func)
+
+    for cls in mod.get("classes", []):
+        cls.pop("source", None)
+        for group, funcs in cls.get("methods", {}).items():
+            for func in funcs:
+                _trim_func(func)
+    return True
 
 
 def trim_report(report: dict) -> dict:
     """Reduce token usage by trimming verbose/redundant fields."""
     import copy
+
     r = copy.deepcopy(report)
 
     r.get("repository", {}).pop("project_structure", None)
+    r["modules"] = [m for m in r.get("modules", []) if _trim_module(m)]
+    return r
 
-    for mod in r.get("modules", []):
-        if not mod.get("functions") and not mod.get("classes") and not mod.get("module_variables"):
-            mod.clear()
-            mod["_skipped"] = True
-            continue
 
-        for func in mod.get("functions", []):
-            _trim_func(func)
+def load_report(path: str) -> dict:
+    """Load and trim a saved report.
 
-        for cls in mod.get("classes", []):
-            cls.pop("source", None)
-            for group, funcs in cls.get("methods", {}).items():
-                for func in funcs:
-                    _trim_func(func)
+    With ijson installed the file is parsed incrementally and each module is
+    trimmed as soon as it is complete, so the untrimmed module list is never
+    held in memory. Otherwise the file is parsed whole and trimmed afterwards.
+    """
+    if ijson is None:
+        with open(path, "rb") as f:
+            return trim_report(json.load(f))
+
+    report: dict = {}
+    modules: list[dict] = []
+    key = None
+    builder = None
+    with open(path, "rb") as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if prefix == "":
+                if event == "map_key":
+                    key = value
+                continue
+            if prefix == "modules" and event in ("start_array", "end_array"):
+                continue
+            if builder is None:
+                builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+            # A value is complete when its closing (or scalar) event arrives at its own prefix.
+            if prefix in ("modules.item", key) and event not in (
+                "start_map",
+                "start_array",
+                "map_key",
+            ):
+                if prefix == "modules.item":
+                    if _trim_module(builder.value):
+                        modules.append(builder.value)
+                else:
+                    report[key] = builder.value
+                builder = None
+
+    report.get("repository", {}).pop("project_structure", None)
+    report["modules"] = modules
+    return report
+
+
+def _batch_key(model: str, thinking: str | None, template: str, block: str) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    for part in (model, thinking or "", template, block):
+        h.update(part.encode())
+        h.update(b"\0")  # Separator, so adjacent parts cannot run together
+    return h.hexdigest()
+
+
+def load_cache(path: Path = CACHE_PATH) -> dict[str, list[dict]]:
+    """Load previously generated test cases keyed by batch hash."""
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
 
-    r["modules"] = [m for m in r["modules"] if "_skipped" not in m]
-    return r
 
+def save_cache(cache: dict[str, list[dict]], path: Path = CACHE_PATH) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(_dumps(cache), encoding="utf-8")
 
-def call_gemini(prompt: str, model: str, thinking: str | None, api_key: str) -> str:
+
+def _model_id(model: str) -> str:
+    return "gemini-3-pro-preview" if model == "pro" else "gemini-3-flash-preview"
+
+
+def cache_template(
+    template: str, model: str, api_key: str, ttl_s: int = 900
+) -> str | None:
+    """Upload the static prompt template as Gemini cached content.
+
+    Returns the cache name, or None when caching is unavailable (e.g. the template
+    is below the model's minimum cacheable size); callers then send it inline.
+    """
     try:
         from google import genai
         from google.genai import types
     except ImportError:
-        print("Error: google-genai not installed. Run: pip install google-genai", file=sys.stderr)
+        return None
+
+    client = genai.Client(api_key=api_key)
+    try:
+        cache = client.caches.create(
+            model=_model_id(model),
+            config=types.CreateCachedContentConfig(
+                contents=[template], ttl=f"{ttl_s}s"
+            ),
+        )
+    except Exception as e:
+        print(
+            f"       Prompt caching unavailable ({e}); sending template inline",
+            file=sys.stderr,
+        )
+        return None
+    return cache.name
+
+
+def _gemini_setup(
+    model: str, thinking: str | None, api_key: str, cached_content: str | None
+):
+    try:
+        from google import genai
+        from google.genai import types
+    except ImportError:
+        print(
+            "Error: google-genai not installed. Run: pip install google-genai",
+            file=sys.stderr,
+        )
         sys.exit(1)
 
     client = genai.Client(api_key=api_key)
-    model_id = "gemini-3-pro-preview" if model == "pro" else "gemini-3-flash-preview"
 
     config_kwargs: dict = {}
     if thinking:
         config_kwargs["thinking_config"] = types.ThinkingConfig(thinking_level=thinking)
+    if cached_content:
+        config_kwargs["cached_content"] = cached_content
 
     config = types.GenerateContentConfig(**config_kwargs) if config_kwargs else None
+    return client, _model_id(model), config
+
+
+def _response_text(response, start: float, label: str = "") -> str:
+    elapsed = time.time() - start
+    print(f"       Response{label} received in {elapsed:.1f}s", file=sys.stderr)
+
+    if hasattr(response, "usage_metadata") and response.usage_metadata:
+        um = response.usage_metadata
+        pt = getattr(um, "prompt_token_count", "?")
+        rt = getattr(um, "candidates_token_count", "?")
+        print(f"       Tokens{label} — prompt: {pt}, response: {rt}", file=sys.stderr)
+
+    return response.text or ""
 
-    print(f"[2/3] Sending to Gemini ({model_id}, {len(prompt):,} chars)...", file=sys.stderr)
+
+def call_gemini(
+    prompt: str,
+    model: str,
+    thinking: str | None,
+    api_key: str,
+    cached_content: str | None = None,
+) -> str:
+    client, model_id, config = _gemini_setup(model, thinking, api_key, cached_content)
+
+    print(
+        f"[2/3] Sending to Gemini ({model_id}, {len(prompt):,} chars)...",
+        file=sys.stderr,
+    )
     start = time.time()
 
     try:
@@ -139,16 +387,69 @@ def call_gemini(prompt: str, model: str, thinking: str | None, api_key: str) ->
         print(f"\nError: Gemini API call failed: {e}", file=sys.stderr)
         sys.exit(1)
 
-    elapsed = time.time() - start
-    print(f"       Response received in {elapsed:.1f}s", file=sys.stderr)
+    return _response_text(response, start)
 
-    if hasattr(response, "usage_metadata") and response.usage_metadata:
-        um = response.usage_metadata
-        pt = getattr(um, "prompt_token_count", "?")
-        rt = getattr(um, "candidates_token_count", "?")
-        print(f"       Tokens — prompt: {pt}, response: {rt}", file=sys.stderr)
 
-    return response.text or ""
+async def _call_gemini_async(
+    prompts: list[str],
+    model: str,
+    thinking: str | None,
+    api_key: str,
+    cached_content: str | None,
+    concurrency: int,
+) -> list[str | None]:
+    client, model_id, config = _gemini_setup(model, thinking, api_key, cached_content)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    total = sum(len(p) for p in prompts)
+    if len(prompts) == 1:
+        print(
+            f"[2/3] Sending to Gemini ({model_id}, {total:,} chars)...", file=sys.stderr
+        )
+    else:
+        print(
+            f"[2/3] Sending {len(prompts)} batches to Gemini ({model_id}, {total:,} chars)...",
+            file=sys.stderr,
+        )
+
+    async def _call_one(idx: int, prompt: str) -> str | None:
+        label = f" {idx + 1}/{len(prompts)}" if len(prompts) > 1 else ""
+        async with semaphore:
+            start = time.time()
+            try:
+                response = await client.aio.models.generate_content(
+                    model=model_id,
+                    contents=prompt,
+                    config=config,
+                )
+            except Exception as e:
+                print(f"\nError: Gemini API call{label} failed: {e}", file=sys.stderr)
+                return None
+        return _response_text(response, start, label)
+
+    return await asyncio.gather(*(_call_one(i, p) for i, p in enumerate(prompts)))
+
+
+def call_gemini_many(
+    prompts: list[str],
+    model: str,
+    thinking: str | None,
+    api_key: str,
+    cached_content: str | None = None,
+    concurrency: int = GEMINI_CONCURRENCY,
+) -> list[str | None]:
+    """Send several prompts concurrently, at most ``concurrency`` in flight.
+
+    A prompt whose call fails yields None, so the caller can keep the others.
+    """
+    if not prompts:
+        return []
+
+    return asyncio.run(
+        _call_gemini_async(
+            prompts, model, thinking, api_key, cached_content, concurrency
+        )
+    )
 
 
 def extract_test_cases(response_text: str) -> list[dict]:
@@ -164,17 +465,17 @@ def extract_test_cases(response_text: str) -> list[dict]:
     # Try raw JSON first
     if text.startswith("["):
         try:
-            result = json.loads(text)
+            result = _loads(text)
             if isinstance(result, list):
                 return result
         except json.JSONDecodeError:
             pass
 
     # Try fenced ```json ... ``` block
-    m = re.search(r'```json\s*\n(.*?)\n```', text, re.DOTALL)
+    m = _FENCED_JSON_RE.search(text)
     if m:
         try:
-            result = json.loads(m.group(1))
+            result = _loads(m.group(1))
             if isinstance(result, list):
                 return result
         except json.JSONDecodeError:
@@ -185,7 +486,7 @@ def extract_test_cases(response_text: str) -> list[dict]:
     end = text.rfind("]")
     if start != -1 and end > start:
         try:
-            result = json.loads(text[start:end + 1])
+            result = _loads(text[start : end + 1])
             if isinstance(result, list):
                 return result
         except json.JSONDecodeError:
@@ -199,48 +500,91 @@ def validate_test_cases(cases: list[dict]) -> tuple[list[dict], list[str]]:
     required_fields = {"name", "description", "steps", "expected_results"}
     valid = []
     warnings = []
+    keep = valid.append
+    warn = warnings.append
 
     for i, tc in enumerate(cases):
         if not isinstance(tc, dict):
-            warnings.append(f"  Item {i}: not a dict, skipped")
+            warn(f"  Item {i}: not a dict, skipped")
             continue
 
-        missing = required_fields - set(tc.keys())
-        if missing:
-            warnings.append(f"  Item {i} ({tc.get('name', '?')}): missing {missing}, skipped")
+        # Fast path: well-formed cases fall straight through every check below.
+        if not required_fields <= tc.keys():
+            warn(
+                f"  Item {i} ({tc.get('name', '?')}): missing {required_fields - tc.keys()}, skipped"
+            )
             continue
 
-        if not tc["name"] or not tc["description"]:
-            warnings.append(f"  Item {i}: empty name or description, skipped")
+        name = tc["name"]
+        if not name or not tc["description"]:
+            warn(f"  Item {i}: empty name or description, skipped")
             continue
 
         # Normalize steps to list
-        if isinstance(tc["steps"], str):
-            tc["steps"] = [s.strip() for s in tc["steps"].split("\n") if s.strip()]
+        steps = tc["steps"]
+        if isinstance(steps, str):
+            steps = tc["steps"] = [s.strip() for s in steps.split("\n") if s.strip()]
 
-        if not isinstance(tc["steps"], list) or not tc["steps"]:
-            warnings.append(f"  Item {i} ({tc['name']}): empty or invalid steps, skipped")
+        if not steps or not isinstance(steps, list):
+            warn(f"  Item {i} ({name}): empty or invalid steps, skipped")
             continue
 
-        if not isinstance(tc["expected_results"], str) or not tc["expected_results"].strip():
-            warnings.append(f"  Item {i} ({tc['name']}): empty expected_results, skipped")
+        expected = tc["expected_results"]
+        if not isinstance(expected, str) or not expected.strip():
+            warn(f"  Item {i} ({name}): empty expected_results, skipped")
             continue
 
-        valid.append(tc)
+        keep(tc)
 
     return valid, warnings
 
 
 def main():
-    parser = argparse.ArgumentParser(description="Generate structured test cases from repo analysis via Gemini.")
-    parser.add_argument("repo_path", nargs="?", help="Path to the repository to analyze")
-    parser.add_argument("--report", help="Use an existing report.json instead of re-analyzing")
-    parser.add_argument("--output", "-o", default=None, help="Output JSON file (default: <repo>/test_cases.json)")
-    parser.add_argument("--model", "-m", choices=["pro", "flash"], default="pro", help="Gemini model (default: pro)")
-    parser.add_argument("--thinking", "-t", choices=["high", "medium", "low"], default=None, help="Thinking level")
-    parser.add_argument("--prompt-template", default=None, help="Custom prompt template .md file")
-    parser.add_argument("--save-prompt", default=None, help="Save assembled prompt to file (for debugging)")
-    parser.add_argument("--save-response", default=None, help="Save raw LLM response to file")
+    parser = argparse.ArgumentParser(
+        description="Generate structured test cases from repo analysis via Gemini."
+    )
+    parser.add_argument(
+        "repo_path", nargs="?", help="Path to the repository to analyze"
+    )
+    parser.add_argument(
+        "--report", help="Use an existing report.json instead of re-analyzing"
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        default=None,
+        help="Output JSON file (default: <repo>/test_cases.json)",
+    )
+    parser.add_argument(
+        "--model",
+        "-m",
+        choices=["pro", "flash"],
+        default="pro",
+        help="Gemini model (default: pro)",
+    )
+    parser.add_argument(
+        "--thinking",
+        "-t",
+        choices=["high", "medium", "low"],
+        default=None,
+        help="Thinking level",
+    )
+    parser.add_argument(
+        "--prompt-template", default=None, help="Custom prompt template .md file"
+    )
+    parser.add_argument(
+        "--save-prompt",
+        default=None,
+        help="Save assembled prompt to file (for debugging)",
+    )
+    parser.add_argument(
+        "--save-response", default=None, help="Save raw LLM response to file"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached test cases for unchanged batches",
+    )
 
     args = parser.parse_args()
 
@@ -251,27 +595,58 @@ def main():
 
     # Step 1: Analysis
     if args.report:
-        report = json.loads(Path(args.report).read_text(encoding="utf-8"))
+        report = load_report(args.report)
         try:
             repo_root = Path(report["repository"]["root_path"])
         except KeyError:
             if not args.output:
-                parser.error("Report missing 'repository.root_path'. Use --output to specify output path.")
+                parser.error(
+                    "Report missing 'repository.root_path'. Use --output to specify output path."
+                )
             repo_root = Path(".")
     else:
         repo_root = Path(args.repo_path).resolve()
         report_path = str(Path(__file__).parent / "report.json")
-        report = run_analysis(str(repo_root), report_path)
+        report = trim_report(run_analysis(str(repo_root), report_path))
 
     # Step 2: Build prompt and call LLM
-    template_path = args.prompt_template or str(Path(__file__).parent / "test_generation_prompt.md")
-    prompt = build_prompt(report, template_path)
+    template_path = args.prompt_template or str(
+        Path(__file__).parent / "test_generation_prompt.md"
+    )
+    template, blocks = build_prompts(report, template_path)
+    prompts = [_render_prompt(template, block) for block in blocks]
 
     if args.save_prompt:
-        Path(args.save_prompt).write_text(prompt, encoding="utf-8")
+        Path(args.save_prompt).write_text(
+            _BATCH_SEPARATOR.join(prompts), encoding="utf-8"
+        )
         print(f"       Saved prompt to {args.save_prompt}", file=sys.stderr)
 
-    response_text = call_gemini(prompt, args.model, args.thinking, api_key)
+    # Batches whose content is byte-identical to a previous run reuse its test cases.
+    cache = {} if args.no_cache else load_cache()
+    keys = [_batch_key(args.model, args.thinking, template, block) for block in blocks]
+    pending = [i for i, key in enumerate(keys) if key not in cache]
+    if len(pending) < len(blocks):
+        print(
+            f"       Reusing cached test cases for {len(blocks) - len(pending)} unchanged batch(es)",
+            file=sys.stderr,
+        )
+
+    # With several batches the template is sent repeatedly; cache it server-side once.
+    cache_name = None
+    if len(blocks) > 1:
+        print(f"       Report split into {len(blocks)} batches", file=sys.stderr)
+    if len(pending) > 1:
+        cache_name = cache_template(template, args.model, api_key)
+    if cache_name:
+        prompts = blocks
+
+    texts = call_gemini_many(
+        [prompts[i] for i in pending], args.model, args.thinking, api_key, cache_name
+    )
+    responses = {i: text for i, text in zip(pending, texts) if text is not None}
+    failed = len(pending) - len(responses)
+    response_text = _BATCH_SEPARATOR.join(responses.values())
 
     if args.save_response:
         Path(args.save_response).write_text(response_text, encoding="utf-8")
@@ -280,7 +655,33 @@ def main():
     # Step 3: Extract, validate, and write test cases
     print("[3/3] Extracting test cases...", file=sys.stderr)
 
-    cases = extract_test_cases(response_text)
+    cases: list[dict] = []
+    for i, key in enumerate(keys):
+        if i in responses:
+            batch_cases = extract_test_cases(responses[i])
+            if batch_cases:
+                cache[key] = batch_cases
+        elif key in cache:
+            batch_cases = cache[key]
+        else:
+            continue  # Gemini call failed for this batch
+        cases.extend(batch_cases)
+
+    # Keep the batches that succeeded, so a rerun only resends the failed ones.
+    # Entries this run did not use are dropped, so the file stays the size of
+    # the current report instead of growing with every past one.
+    if not args.no_cache:
+        used = {key: cache[key] for key in keys if key in cache}
+        if responses or len(used) < len(cache):
+            save_cache(used)
+
+    if failed:
+        print(
+            f"\nError: {failed} of {len(pending)} Gemini batch(es) failed; rerun to retry them.",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
     if not cases:
         print("\nError: Could not extract test cases from response.", file=sys.stderr)
         fallback = Path(args.output or "raw_response.txt")
@@ -298,7 +699,7 @@ def main():
     # Write output
     output_path = Path(args.output) if args.output else repo_root / "test_cases.json"
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(valid, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    output_path.write_text(_dumps(valid) + "\n", encoding="utf-8")
 
     print(f"\nDone! {len(valid)} test cases written to {output_path}", file=sys.stderr)
     if len(valid) != len(cases):
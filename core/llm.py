@@ -17,6 +17,7 @@ from enum import Enum
 import asyncio
 import hashlib
 import json
+import string
 from datetime import datetime, timedelta
 
 try:
@@ -28,6 +29,14 @@ except ImportError:
     REDIS_AVAILABLE = False
     print("⚠️ aioredis not available - Redis caching disabled")
 
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None
+    MSGPACK_AVAILABLE = False
+
 from pydantic import BaseModel
 
 
@@ -49,7 +58,13 @@ class MessageRole(Enum):
     ASSISTANT = "assistant"
 
 
-@dataclass
+# Enum .value goes through a descriptor; plain dict lookups are cheaper in
+# per-message loops.
+_ROLE_VALUE: Dict[MessageRole, str] = {role: role.value for role in MessageRole}
+_PROVIDER_VALUE: Dict[LLMProvider, str] = {p: p.value for p in LLMProvider}
+
+
+@dataclass(slots=True)
 class LLMMessage:
     """LLM message structure"""
 
@@ -58,7 +73,7 @@ class LLMMessage:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResponse:
     """LLM response structure"""
 
@@ -71,7 +86,7 @@ class LLMResponse:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMConfig:
     """LLM configuration"""
 
@@ -115,6 +130,12 @@ class BaseLLMProvider(ABC):
         pass
 
 
+def _to_openai_messages(messages: List[LLMMessage]) -> List[Dict[str, str]]:
+    """Convert messages to the OpenAI chat format"""
+    role_value = _ROLE_VALUE
+    return [{"role": role_value[msg.role], "content": msg.content} for msg in messages]
+
+
 class OpenAIProvider(BaseLLMProvider):
     """OpenAI API provider implementation"""
 
@@ -128,15 +149,10 @@ class OpenAIProvider(BaseLLMProvider):
         """Generate response using OpenAI API"""
         start_time = datetime.now()
 
-        # Convert messages to OpenAI format
-        openai_messages = [
-            {"role": msg.role.value, "content": msg.content} for msg in messages
-        ]
-
         try:
             response = await self.client.chat.completions.create(
                 model=self.config.model,
-                messages=openai_messages,
+                messages=_to_openai_messages(messages),
                 temperature=self.config.temperature,
                 max_tokens=self.config.max_tokens,
                 **kwargs,
@@ -166,14 +182,10 @@ class OpenAIProvider(BaseLLMProvider):
         self, messages: List[LLMMessage], **kwargs
     ) -> AsyncGenerator[str, None]:
         """Generate streaming response using OpenAI API"""
-        openai_messages = [
-            {"role": msg.role.value, "content": msg.content} for msg in messages
-        ]
-
         try:
             stream = await self.client.chat.completions.create(
                 model=self.config.model,
-                messages=openai_messages,
+                messages=_to_openai_messages(messages),
                 temperature=self.config.temperature,
                 max_tokens=self.config.max_tokens,
                 stream=True,
@@ -215,14 +227,25 @@ class OpenAIProvider(BaseLLMProvider):
 class PromptTemplate:
     """Template for LLM prompts with variable substitution"""
 
+    __slots__ = ("template", "variables", "_fields")
+
     def __init__(self, template: str, variables: List[str] = None):
         self.template = template
         self.variables = variables or []
+        # Top-level names referenced by the template, parsed once up front
+        self._fields = frozenset(
+            name.split(".", 1)[0].split("[", 1)[0]
+            for _, name, _, _ in string.Formatter().parse(template)
+            if name
+        )
 
     def render(self, **kwargs) -> str:
         """Render the template with provided variables"""
+        missing = self._fields - kwargs.keys()
+        if missing:
+            raise ValueError(f"Missing template variable: {sorted(missing)[0]!r}")
         try:
-            return self.template.format(**kwargs)
+            return self.template.format_map(kwargs)
         except KeyError as e:
             raise ValueError(f"Missing template variable: {e}")
 
@@ -230,6 +253,8 @@ class PromptTemplate:
 class LLMManager:
     """Central manager for LLM operations with caching and cost tracking"""
 
+    __slots__ = ("_providers", "_templates", "_redis_url", "_redis")
+
     def __init__(self, redis_url: str = "redis://localhost:6379"):
         self._providers: Dict[str, BaseLLMProvider] = {}
         self._templates: Dict[str, PromptTemplate] = {}
@@ -268,17 +293,16 @@ class LLMManager:
     ) -> LLMResponse:
         """Generate LLM response with caching and cost tracking"""
 
-        if provider_name not in self._providers:
+        provider = self._providers.get(provider_name)
+        if provider is None:
             raise ValueError(f"Provider {provider_name} not found")
 
-        provider = self._providers[provider_name]
-
         # Handle template rendering
         if template_name:
-            if template_name not in self._templates:
+            template = self._templates.get(template_name)
+            if template is None:
                 raise ValueError(f"Template {template_name} not found")
 
-            template = self._templates[template_name]
             rendered_content = template.render(**(template_vars or {}))
 
             if isinstance(messages, str):
@@ -317,11 +341,10 @@ class LLMManager:
         self, provider_name: str, messages: Union[List[LLMMessage], str], **kwargs
     ) -> AsyncGenerator[str, None]:
         """Generate streaming response"""
-        if provider_name not in self._providers:
+        provider = self._providers.get(provider_name)
+        if provider is None:
             raise ValueError(f"Provider {provider_name} not found")
 
-        provider = self._providers[provider_name]
-
         if isinstance(messages, str):
             messages = [LLMMessage(role=MessageRole.USER, content=messages)]
 
@@ -347,23 +370,31 @@ class LLMManager:
         self, provider_name: str, messages: List[LLMMessage], kwargs: Dict[str, Any]
     ) -> str:
         """Generate cache key for request"""
-        content = json.dumps(
-            {
-                "provider": provider_name,
-                "messages": [(m.role.value, m.content) for m in messages],
-                "kwargs": kwargs,
-            },
-            sort_keys=True,
-        )
-
-        return f"llm_cache:{hashlib.md5(content.encode()).hexdigest()}"
+        # Hash incrementally so the message history is never copied into one
+        # large JSON string; NUL separators keep field boundaries unambiguous.
+        h = hashlib.blake2b(digest_size=16)
+        h.update(provider_name.encode())
+        for m in messages:
+            h.update(b"\0")
+            h.update(_ROLE_VALUE[m.role].encode())
+            h.update(b"\0")
+            h.update(m.content.encode())
+        h.update(b"\0")
+        h.update(json.dumps(kwargs, sort_keys=True, default=str).encode())
+
+        return f"llm_cache:{h.hexdigest()}"
 
     async def _get_cached_response(self, cache_key: str) -> Optional[LLMResponse]:
         """Get cached response"""
         try:
             cached = await self._redis.get(cache_key)
             if cached:
-                data = json.loads(cached)
+                data = (
+                    msgpack.unpackb(cached, raw=False)
+                    if MSGPACK_AVAILABLE
+                    else json.loads(cached)
+                )
+                data["provider"] = LLMProvider(data["provider"])
                 return LLMResponse(**data)
         except Exception:
             pass
@@ -372,9 +403,10 @@ class LLMManager:
     async def _cache_response(self, cache_key: str, response: LLMResponse):
         """Cache response"""
         try:
+            provider_value = _PROVIDER_VALUE[response.provider]
             data = {
                 "content": response.content,
-                "provider": response.provider.value,
+                "provider": provider_value,
                 "model": response.model,
                 "tokens_used": response.tokens_used,
                 "cost": response.cost,
@@ -383,8 +415,12 @@ class LLMManager:
             }
             await self._redis.setex(
                 cache_key,
-                self._providers[response.provider.value].config.cache_ttl,
-                json.dumps(data),
+                self._providers[provider_value].config.cache_ttl,
+                (
+                    msgpack.packb(data, use_bin_type=True)
+                    if MSGPACK_AVAILABLE
+                    else json.dumps(data)
+                ),
             )
         except Exception:
             pass
@@ -396,10 +432,13 @@ class LLMManager:
                 usage_key = (
                     f"usage:{datetime.now().strftime('%Y-%m-%d')}:{provider_name}"
                 )
-                await self._redis.hincrby(usage_key, "requests", 1)
-                await self._redis.hincrby(usage_key, "tokens", response.tokens_used)
-                await self._redis.hincrbyfloat(usage_key, "cost", response.cost)
-                await self._redis.expire(usage_key, 86400 * 30)  # Keep for 30 days
+                # One round-trip for all four commands
+                async with self._redis.pipeline(transaction=False) as pipe:
+                    pipe.hincrby(usage_key, "requests", 1)
+                    pipe.hincrby(usage_key, "tokens", response.tokens_used)
+                    pipe.hincrbyfloat(usage_key, "cost", response.cost)
+                    pipe.expire(usage_key, 86400 * 30)  # Keep for 30 days
+                    await pipe.execute()
         except Exception:
             pass
 
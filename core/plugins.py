@@ -6,13 +6,30 @@ Each app (Web Testing, Data Quality, etc.) is implemented as a plugin.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, Type
+from typing import Dict, Any, Iterator, List, Mapping, Optional, Tuple, Type
 from dataclasses import dataclass
 from enum import Enum
-import importlib
-import inspect
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import hashlib
+import importlib.util
+import os
+import sys
+import types
+from types import MappingProxyType
+import zipfile
+import json
 from pathlib import Path
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 
 class PluginStatus(Enum):
     """Plugin status enumeration"""
@@ -23,7 +40,7 @@ class PluginStatus(Enum):
     LOADING = "loading"
 
 
-@dataclass
+@dataclass(slots=True)
 class PluginMetadata:
     """Plugin metadata structure"""
 
@@ -43,6 +60,8 @@ class BasePlugin(ABC):
     def __init__(self, config: Dict[str, Any] = None):
         self.config = config or {}
         self._metadata: Optional[PluginMetadata] = None
+        self._api_routes: Optional[List[Dict[str, Any]]] = None
+        self._frontend_routes: Optional[List[Dict[str, Any]]] = None
 
     @property
     @abstractmethod
@@ -71,6 +90,7 @@ class BasePlugin(ABC):
         """
         Return API routes for this plugin
         Format: [{"path": "/api/v1/plugin", "router": router_instance}]
+        An optional "tag" key overrides the OpenAPI tag (default: last path segment)
         """
         pass
 
@@ -82,6 +102,18 @@ class BasePlugin(ABC):
         """
         pass
 
+    def api_routes(self) -> List[Dict[str, Any]]:
+        """API routes for this plugin, built once by get_api_routes()"""
+        if self._api_routes is None:
+            self._api_routes = self.get_api_routes()
+        return self._api_routes
+
+    def frontend_routes(self) -> List[Dict[str, Any]]:
+        """Frontend routes for this plugin, built once by get_frontend_routes()"""
+        if self._frontend_routes is None:
+            self._frontend_routes = self.get_frontend_routes()
+        return self._frontend_routes
+
     async def validate_config(self, config: Dict[str, Any]) -> bool:
         """Validate plugin configuration"""
         return True
@@ -95,12 +127,109 @@ class BasePlugin(ABC):
         }
 
 
+# Plugin API versions this manager can load
+_SUPPORTED_API_VERSIONS = frozenset(("1.0", "1.1"))
+
+# Per plugin file path: (mtime_ns, module name, plugin classes). Repeat discovery
+# skips re-executing unchanged files, and an edited file replaces its entry
+_discovered_cache: Dict[str, Tuple[int, str, List[Type[BasePlugin]]]] = {}
+
+# Upper bound on threads used to import plugin files during discovery
+_MAX_DISCOVERY_WORKERS = 8
+
+
+def _iter_plugin_files(root: str) -> Iterator[os.DirEntry]:
+    """Yield every plugin.py below root, skipping hidden directories"""
+    pending = deque([root])
+    while pending:
+        try:
+            with os.scandir(pending.popleft()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith((".", "__pycache__")):
+                            pending.append(entry.path)
+                    elif entry.name == "plugin.py" and entry.is_file():
+                        yield entry
+        except OSError:
+            continue
+
+
+def _plugin_module_name(plugin_file: Path, taken: set) -> str:
+    """Stable module name for a plugin file, unique per path"""
+    cached = _discovered_cache.get(str(plugin_file))
+    if cached is not None:
+        return cached[1]
+    module_name = f"plugin_{plugin_file.parent.name}"
+    existing = sys.modules.get(module_name)
+    if module_name in taken or (
+        existing is not None and getattr(existing, "__file__", None) != str(plugin_file)
+    ):
+        # Another plugin directory with the same name already owns it
+        digest = hashlib.blake2b(str(plugin_file).encode(), digest_size=4).hexdigest()
+        module_name = f"{module_name}_{digest}"
+    taken.add(module_name)
+    return module_name
+
+
+def _load_plugin_classes(plugin_file: Path, module_name: str) -> List[Type[BasePlugin]]:
+    """Import a plugin file and return the plugin classes it defines"""
+    spec = importlib.util.spec_from_file_location(module_name, plugin_file)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    sys.modules[module_name] = module
+    return _plugin_classes(module)
+
+
+def _load_bundled_plugin_classes(
+    module_name: str, reload: bool
+) -> List[Type[BasePlugin]]:
+    """Import a plugin module from a zip bundle on sys.path via zipimport"""
+    if reload:
+        # The archive changed: drop the plugin's stale package and its
+        # submodules so they are re-imported from the new archive
+        package = module_name.rpartition(".")[0]
+        for name in [
+            n for n in sys.modules if n == package or n.startswith(package + ".")
+        ]:
+            del sys.modules[name]
+    return _plugin_classes(importlib.import_module(module_name))
+
+
+def _plugin_classes(module: types.ModuleType) -> List[Type[BasePlugin]]:
+    """Plugin classes defined in a module"""
+    module_name = module.__name__
+    # Only classes defined in this file; imported plugin bases are skipped
+    return [
+        obj
+        for obj in vars(module).values()
+        if isinstance(obj, type)
+        and issubclass(obj, BasePlugin)
+        and obj is not BasePlugin
+        and obj.__module__ == module_name
+    ]
+
+
+class _PluginRecord:
+    """A registered plugin instance together with its registry metadata"""
+
+    __slots__ = ("plugin", "metadata")
+
+    def __init__(self, plugin: BasePlugin, metadata: PluginMetadata):
+        self.plugin = plugin
+        self.metadata = metadata
+
+
 class PluginManager:
     """Manages plugin lifecycle and registry"""
 
     def __init__(self):
-        self._plugins: Dict[str, BasePlugin] = {}
-        self._plugin_metadata: Dict[str, PluginMetadata] = {}
+        self._records: Dict[str, _PluginRecord] = {}
+        # Derived from the registry; cleared by _invalidate_caches()
+        self._active_cache: Optional[Tuple[str, ...]] = None
+        self._api_routes_cache: Optional[List[Dict[str, Any]]] = None
+        self._frontend_routes_cache: Optional[List[Dict[str, Any]]] = None
+        self._summary_json_cache: Optional[bytes] = None
+        self._metadata_view: Optional[Mapping[str, PluginMetadata]] = None
 
     async def register_plugin(
         self, plugin_class: Type[BasePlugin], config: Dict[str, Any] = None
@@ -124,9 +253,9 @@ class PluginManager:
             if not await plugin.initialize():
                 raise RuntimeError("Plugin initialization failed")
 
-            self._plugins[metadata.name] = plugin
-            self._plugin_metadata[metadata.name] = metadata
+            self._records[metadata.name] = _PluginRecord(plugin, metadata)
             metadata.status = PluginStatus.ACTIVE
+            self._invalidate_caches()
 
             return True
 
@@ -137,98 +266,217 @@ class PluginManager:
 
     async def unregister_plugin(self, plugin_name: str) -> bool:
         """Unregister a plugin"""
-        if plugin_name not in self._plugins:
+        record = self._records.get(plugin_name)
+        if record is None:
             return False
 
-        plugin = self._plugins[plugin_name]
         try:
-            await plugin.cleanup()
-            del self._plugins[plugin_name]
-            del self._plugin_metadata[plugin_name]
+            await record.plugin.cleanup()
+            del self._records[plugin_name]
+            self._invalidate_caches()
             return True
         except Exception:
             return False
 
     def get_plugin(self, plugin_name: str) -> Optional[BasePlugin]:
         """Get a registered plugin"""
-        return self._plugins.get(plugin_name)
+        record = self._records.get(plugin_name)
+        return record.plugin if record else None
+
+    def list_plugins(self) -> Mapping[str, PluginMetadata]:
+        """List all registered plugins as a read-only name -> metadata view
 
-    def list_plugins(self) -> Dict[str, PluginMetadata]:
-        """List all registered plugins"""
-        return self._plugin_metadata.copy()
+        Use register_plugin/unregister_plugin to change the registry.
+        """
+        if self._metadata_view is None:
+            self._metadata_view = MappingProxyType(
+                {name: record.metadata for name, record in self._records.items()}
+            )
+        return self._metadata_view
+
+    def get_plugins_summary_json(self) -> bytes:
+        """Serialized plugin listing for the /api/v1/plugins endpoint"""
+        if self._summary_json_cache is None:
+            payload = {
+                "plugins": {
+                    name: {
+                        "name": record.metadata.name,
+                        "version": record.metadata.version,
+                        "description": record.metadata.description,
+                        "status": record.metadata.status.value,
+                        "author": record.metadata.author,
+                        "dependencies": record.metadata.dependencies,
+                    }
+                    for name, record in self._records.items()
+                },
+                "total": len(self._records),
+            }
+            self._summary_json_cache = (
+                orjson.dumps(payload)
+                if ORJSON_AVAILABLE
+                else json.dumps(payload).encode()
+            )
+        return self._summary_json_cache
 
     def get_active_plugins(self) -> List[str]:
         """Get list of active plugin names"""
-        return [
-            name
-            for name, metadata in self._plugin_metadata.items()
-            if metadata.status == PluginStatus.ACTIVE
-        ]
+        # Rebuilt only after register/unregister change the registry
+        if self._active_cache is None:
+            self._active_cache = tuple(
+                name
+                for name, record in self._records.items()
+                if record.metadata.status is PluginStatus.ACTIVE
+            )
+        return list(self._active_cache)
 
     async def discover_plugins(self, plugins_dir: Path) -> List[Type[BasePlugin]]:
-        """Discover plugins in a directory"""
-        discovered = []
+        """Discover plugins in a directory or a zip bundle of plugin packages"""
+        if plugins_dir.is_file() and zipfile.is_zipfile(plugins_dir):
+            return self._discover_bundle(plugins_dir)
 
-        for plugin_file in plugins_dir.glob("**/plugin.py"):
+        results: Dict[str, Any] = {}
+        misses: List[Tuple[str, int, str]] = []
+        taken = {name for _, name, _ in _discovered_cache.values()}
+
+        for entry in _iter_plugin_files(str(plugins_dir)):
             try:
-                # Import the plugin module
-                spec = importlib.util.spec_from_file_location(
-                    f"plugin_{plugin_file.parent.name}", plugin_file
+                mtime_ns = entry.stat().st_mtime_ns
+            except OSError as e:
+                results[entry.path] = e
+                continue
+            # Unchanged files reuse the classes found on a previous scan
+            cached = _discovered_cache.get(entry.path)
+            if cached is not None and cached[0] == mtime_ns:
+                results[entry.path] = cached[2]
+            else:
+                module_name = _plugin_module_name(Path(entry.path), taken)
+                misses.append((entry.path, mtime_ns, module_name))
+                results[entry.path] = None
+
+        # Import new or changed plugin files concurrently; their import-time
+        # I/O overlaps even though module execution holds the GIL
+        if misses:
+            loop = asyncio.get_running_loop()
+            workers = min(_MAX_DISCOVERY_WORKERS, len(misses), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                loaded = await asyncio.gather(
+                    *(
+                        loop.run_in_executor(
+                            pool, _load_plugin_classes, Path(path), module_name
+                        )
+                        for path, _, module_name in misses
+                    ),
+                    return_exceptions=True,
                 )
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-
-                # Find plugin classes
-                for name, obj in inspect.getmembers(module):
-                    if (
-                        inspect.isclass(obj)
-                        and issubclass(obj, BasePlugin)
-                        and obj != BasePlugin
-                    ):
-                        discovered.append(obj)
-
+            for (path, mtime_ns, module_name), classes in zip(misses, loaded):
+                if not isinstance(classes, BaseException):
+                    _discovered_cache[path] = (mtime_ns, module_name, classes)
+                results[path] = classes
+
+        discovered: Dict[int, Type[BasePlugin]] = {}
+        for path, classes in results.items():
+            if isinstance(classes, BaseException):
+                print(f"Failed to load plugin from {path}: {classes}")
+                continue
+            for cls in classes:
+                discovered.setdefault(id(cls), cls)
+
+        return list(discovered.values())
+
+    def _discover_bundle(self, archive: Path) -> List[Type[BasePlugin]]:
+        """Discover plugins inside a zip bundle (e.g. ``zip -r apps.pyz apps/``)
+
+        Deployed images can ship every plugin in one archive: a single open
+        and in-memory reads replace a directory walk plus one file per plugin.
+        """
+        discovered: List[Type[BasePlugin]] = []
+        archive_mtime = archive.stat().st_mtime_ns
+
+        # Plugins are imported as regular packages (apps.<name>.plugin) so
+        # their relative and sibling imports resolve inside the archive
+        archive_path = str(archive)
+        if archive_path not in sys.path:
+            sys.path.insert(0, archive_path)
+        stale = False
+
+        with zipfile.ZipFile(archive) as bundle:
+            members = bundle.namelist()
+
+        for member in members:
+            if member.rsplit("/", 1)[-1] != "plugin.py":
+                continue
+            origin = f"{archive}/{member}"
+            cached = _discovered_cache.get(origin)
+            if cached is not None and cached[0] == archive_mtime:
+                discovered.extend(cached[2])
+                continue
+            if cached is not None and not stale:
+                # Let zipimport re-read the rebuilt archive's directory
+                importlib.invalidate_caches()
+                stale = True
+            module_name = member[: -len(".py")].replace("/", ".")
+            try:
+                classes = _load_bundled_plugin_classes(module_name, cached is not None)
             except Exception as e:
-                print(f"Failed to load plugin from {plugin_file}: {e}")
+                print(f"Failed to load plugin from {origin}: {e}")
+                continue
+            _discovered_cache[origin] = (archive_mtime, module_name, classes)
+            discovered.extend(classes)
 
         return discovered
 
     async def get_all_api_routes(self) -> List[Dict[str, Any]]:
         """Get API routes from all active plugins"""
-        routes = []
-        for plugin in self._plugins.values():
-            if (
-                self._plugin_metadata[plugin.metadata.name].status
-                == PluginStatus.ACTIVE
-            ):
-                routes.extend(plugin.get_api_routes())
-        return routes
+        if self._api_routes_cache is None:
+            routes = []
+            extend = routes.extend
+            active = PluginStatus.ACTIVE
+            for record in self._records.values():
+                if record.metadata.status is active:
+                    extend(record.plugin.api_routes())
+            self._api_routes_cache = routes
+        return list(self._api_routes_cache)
 
     async def get_all_frontend_routes(self) -> List[Dict[str, Any]]:
         """Get frontend routes from all active plugins"""
-        routes = []
-        for plugin in self._plugins.values():
-            if (
-                self._plugin_metadata[plugin.metadata.name].status
-                == PluginStatus.ACTIVE
-            ):
-                routes.extend(plugin.get_frontend_routes())
-        return routes
+        if self._frontend_routes_cache is None:
+            routes = []
+            extend = routes.extend
+            active = PluginStatus.ACTIVE
+            for record in self._records.values():
+                if record.metadata.status is active:
+                    extend(record.plugin.frontend_routes())
+            self._frontend_routes_cache = routes
+        return list(self._frontend_routes_cache)
+
+    def _invalidate_caches(self):
+        """Drop registry-derived caches after a register/unregister"""
+        self._active_cache = None
+        self._api_routes_cache = None
+        self._frontend_routes_cache = None
+        self._summary_json_cache = None
+        self._metadata_view = None
 
     async def health_check_all(self) -> Dict[str, Any]:
         """Run health checks on all plugins"""
-        results = {}
-        for name, plugin in self._plugins.items():
+
+        async def _check(plugin: BasePlugin) -> Dict[str, Any]:
             try:
-                results[name] = await plugin.health_check()
+                return await plugin.health_check()
             except Exception as e:
-                results[name] = {"status": "error", "message": str(e), "details": {}}
-        return results
+                return {"status": "error", "message": str(e), "details": {}}
+
+        # Checks run concurrently so slow plugins don't add up
+        names = list(self._records)
+        results = await asyncio.gather(
+            *(_check(self._records[name].plugin) for name in names)
+        )
+        return dict(zip(names, results))
 
     def _is_api_compatible(self, plugin_api_version: str) -> bool:
         """Check if plugin API version is compatible"""
         # Simple version check - in production, use proper semantic versioning
-        supported_versions = ["1.0", "1.1"]
-        return plugin_api_version in supported_versions
+        return plugin_api_version in _SUPPORTED_API_VERSIONS
 
 
 # Global plugin manager instance
@@ -7,9 +7,11 @@ allowing dynamic loading of AI-powered applications.
 
 from fastapi import FastAPI, Depends, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from contextlib import asynccontextmanager
 from pathlib import Path
+import functools
+import logging
 import os
 from typing import Dict, Any
 
@@ -20,21 +22,34 @@ from v1.backend.app.api.health import router as health_router
 
 # Import new core modules
 from core.plugins import plugin_manager, BasePlugin
-from core.llm import llm_manager, OpenAIProvider, LLMConfig, LLMProvider
+
+# Child of uvicorn's logger so startup messages share its handlers and level
+logger = logging.getLogger("uvicorn.error").getChild("ai_base")
+
+
+@functools.cache
+def _llm_manager():
+    """Import the LLM stack on first use to keep it off the import-time path"""
+    from core.llm import llm_manager
+
+    return llm_manager
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan management"""
     # Startup
-    print("🚀 Starting AI Base Platform...")
+    logger.info("🚀 Starting AI Base Platform...")
 
     # Initialize LLM manager
+    llm_manager = _llm_manager()
     await llm_manager.initialize()
 
     # Configure LLM providers
     settings = get_settings()
-    if hasattr(settings, "openai_api_key") and settings.openai_api_key:
+    if getattr(settings, "openai_api_key", None):
+        from core.llm import OpenAIProvider, LLMConfig, LLMProvider
+
         openai_config = LLMConfig(
             provider=LLMProvider.OPENAI,
             model="gpt-4",
@@ -44,7 +59,7 @@ async def lifespan(app: FastAPI):
         )
         openai_provider = OpenAIProvider(openai_config)
         llm_manager.register_provider("openai", openai_provider)
-        print("✅ OpenAI provider configured")
+        logger.info("✅ OpenAI provider configured")
 
     # Discover and load plugins
     await load_plugins()
@@ -52,50 +67,55 @@ async def lifespan(app: FastAPI):
     # Register plugin routes
     await register_plugin_routes(app)
 
-    print("✅ AI Base Platform started successfully!")
-    print(f"📋 Loaded plugins: {list(plugin_manager.list_plugins().keys())}")
+    logger.info("✅ AI Base Platform started successfully!")
+    logger.info("📋 Loaded plugins: %s", list(plugin_manager.list_plugins().keys()))
 
     yield
 
     # Shutdown
-    print("🛑 Shutting down AI Base Platform...")
+    logger.info("🛑 Shutting down AI Base Platform...")
     for plugin_name in plugin_manager.get_active_plugins():
         await plugin_manager.unregister_plugin(plugin_name)
-    print("✅ AI Base Platform shutdown complete")
+    logger.info("✅ AI Base Platform shutdown complete")
 
 
 async def load_plugins():
     """Discover and load all available plugins"""
-    apps_dir = Path(__file__).parent / "apps"
+    # Deployed images may ship the plugins as one zip bundle (zip -r apps.pyz apps/);
+    # the apps/ directory remains the development path
+    bundle = Path(
+        os.environ.get("AI_BASE_PLUGIN_BUNDLE", Path(__file__).parent / "apps.pyz")
+    )
+    apps_dir = bundle if bundle.is_file() else Path(__file__).parent / "apps"
 
     if not apps_dir.exists():
-        print("⚠️ No apps directory found")
+        logger.warning("⚠️ No apps directory found")
         return
 
     # Discover plugins
     discovered_plugins = await plugin_manager.discover_plugins(apps_dir)
-    print(f"🔍 Discovered {len(discovered_plugins)} plugins")
+    logger.info("🔍 Discovered %d plugins", len(discovered_plugins))
 
     # Load each plugin
     for plugin_class in discovered_plugins:
         try:
             await plugin_manager.register_plugin(plugin_class, config={})
-            print(f"✅ Loaded plugin: {plugin_class.__name__}")
+            logger.info("✅ Loaded plugin: %s", plugin_class.__name__)
         except Exception as e:
-            print(f"❌ Failed to load plugin {plugin_class.__name__}: {e}")
+            logger.error("❌ Failed to load plugin %s: %s", plugin_class.__name__, e)
 
 
 async def register_plugin_routes(app: FastAPI):
     """Register API routes from all active plugins"""
     api_routes = await plugin_manager.get_all_api_routes()
 
+    include_router = app.include_router
     for route_info in api_routes:
-        app.include_router(
-            route_info["router"],
-            prefix=route_info["path"],
-            tags=[route_info["path"].split("/")[-1]],
-        )
-        print(f"📡 Registered API route: {route_info['path']}")
+        path = route_info["path"]
+        # Plugins may name the tag explicitly; default to the last path segment
+        tag = route_info.get("tag") or path.rsplit("/", 1)[-1]
+        include_router(route_info["router"], prefix=path, tags=[tag])
+        logger.info("📡 Registered API route: %s", path)
 
 
 # Create FastAPI app with lifespan
@@ -104,6 +124,7 @@ app = FastAPI(
     description="Extensible platform for AI-powered development tools",
     version="2.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -142,21 +163,11 @@ async def get_plugins_health():
 @app.get("/api/v1/plugins")
 async def list_plugins():
     """List all registered plugins"""
-    plugins = plugin_manager.list_plugins()
-    return {
-        "plugins": {
-            name: {
-                "name": metadata.name,
-                "version": metadata.version,
-                "description": metadata.description,
-                "status": metadata.status.value,
-                "author": metadata.author,
-                "dependencies": metadata.dependencies,
-            }
-            for name, metadata in plugins.items()
-        },
-        "total": len(plugins),
-    }
+    # Serialized once per registry change by the plugin manager
+    return Response(
+        content=plugin_manager.get_plugins_summary_json(),
+        media_type="application/json",
+    )
 
 
 @app.get("/api/v1/plugins/{plugin_name}/info")
@@ -178,8 +189,8 @@ async def get_plugin_info(plugin_name: str):
         "api_version": metadata.api_version,
         "dependencies": metadata.dependencies,
         "health": health,
-        "api_routes": plugin.get_api_routes(),
-        "frontend_routes": plugin.get_frontend_routes(),
+        "api_routes": plugin.api_routes(),
+        "frontend_routes": plugin.frontend_routes(),
     }
 
 
@@ -195,6 +206,7 @@ async def get_frontend_routes():
 @app.get("/api/v1/llm/providers")
 async def list_llm_providers():
     """List available LLM providers"""
+    llm_manager = _llm_manager()
     return {
         "providers": list(llm_manager._providers.keys()),
         "templates": list(llm_manager._templates.keys()),
@@ -205,7 +217,7 @@ async def list_llm_providers():
 async def get_llm_usage(days: int = 7):
     """Get LLM usage statistics"""
     try:
-        usage_stats = await llm_manager.get_usage_stats(days)
+        usage_stats = await _llm_manager().get_usage_stats(days)
         return usage_stats
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -223,7 +235,7 @@ async def root():
         "status": "running",
         "active_plugins": active_plugins,
         "total_plugins": len(plugin_manager.list_plugins()),
-        "llm_providers": list(llm_manager._providers.keys()),
+        "llm_providers": list(_llm_manager()._providers.keys()),
         "api_docs": "/docs",
         "frontend_url": "http://localhost:3000",
     }
@@ -248,6 +260,16 @@ async def not_found_handler(request, exc):
 
 
 if __name__ == "__main__":
+    import importlib.util
     import uvicorn
 
-    uvicorn.run("main:app", host="localhost", port=8001, reload=True, log_level="info")
+    # uvloop (libuv-based) is not available on Windows; fall back to asyncio there
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    uvicorn.run(
+        "main:app",
+        host="localhost",
+        port=8001,
+        reload=True,
+        log_level="info",
+        loop=loop,
+    )
@@ -0,0 +1,69 @@
+"""
+Regression tests for utils/code_extractor.py
+"""
+
+import contextlib
+import io
+import logging
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+# utils is a plain script directory, not a package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "utils"))
+
+from code_extractor import GenericCodeExtractor, setup_logging  # noqa: E402
+
+
+@pytest.fixture
+def extractor():
+    return GenericCodeExtractor()
+
+
+@pytest.mark.parametrize(
+    "content, language",
+    [
+        ("fn main() { let mut x = 5; }", "rust"),
+        ("fun main() { val x = 1; var y = 2 }", "kotlin"),
+        (".button { color: red; }", "css"),
+    ],
+)
+def test_detect_language_counts_overlapping_patterns(extractor, content, language):
+    assert extractor._detect_language(content) == language
+
+
+def test_setup_logging_follows_redirected_stderr():
+    for _ in range(2):
+        buffer = io.StringIO()
+        with contextlib.redirect_stderr(buffer):
+            setup_logging("INFO")
+            logging.getLogger("code_extractor.test").info("hello")
+        assert "hello" in buffer.getvalue()
+
+
+@pytest.mark.parametrize("output_format", ["files", "json"])
+def test_export_recreates_deleted_output_dir(extractor, tmp_path, output_format):
+    codes = extractor.extract("```python\ndef hello():\n    return 'world'\n```")
+    out_dir = tmp_path / "out"
+    target = out_dir if output_format == "files" else out_dir / "codes.json"
+    for _ in range(2):
+        extractor.export(codes, output_format, str(target))
+        assert any(out_dir.iterdir())
+        shutil.rmtree(out_dir)
+
+
+def test_html_code_nested_in_pre_is_extracted(extractor):
+    html = (
+        '<html><body><pre><code class="python">def f():\n'
+        "    return 1\n</code></pre></body></html>"
+    )
+    codes = extractor.extract(html)
+    nested = [
+        code
+        for code in codes
+        if code.extraction_method == "html_code"
+        and code.context.get("tag_type") == "html_pre"
+    ]
+    assert [code.content for code in nested] == ["def f():\n    return 1"]
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Persistent worker process for cli_examples.py
+
+Reads one JSON command per line from stdin ({"argv": [...]}), runs
+code_extractor.main(argv) in-process, and writes one JSON line back with
+the captured stdout, stderr and exit code.
+"""
+
+import contextlib
+import io
+import json
+import sys
+
+import code_extractor
+
+
+def run(argv):
+    """Run the code extractor CLI once, capturing its output"""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    returncode = 0
+
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            code_extractor.main(argv)
+        except SystemExit as e:
+            if e.code is None:
+                returncode = 0
+            elif isinstance(e.code, int):
+                returncode = e.code
+            else:
+                print(e.code, file=sys.stderr)
+                returncode = 1
+        except Exception as e:
+            print(f"{type(e).__name__}: {e}", file=sys.stderr)
+            returncode = 1
+
+    return {
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+        "returncode": returncode,
+    }
+
+
+def main():
+    sys.argv[0] = "code_extractor.py"  # so argparse usage text names the real CLI
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        result = run(json.loads(line)["argv"])
+        sys.stdout.write(json.dumps(result) + "\n")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
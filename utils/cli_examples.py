@@ -6,29 +6,76 @@ This script demonstrates various command-line usage patterns for the
 GenericCodeExtractor when working with the EXTRACTOR_USAGE_GUIDE.md file.
 """
 
+import atexit
+import json
+import shlex
 import subprocess
 import sys
 from pathlib import Path
 
+HERE = Path(__file__).parent
+GUIDE_PATH = HERE / "EXTRACTOR_USAGE_GUIDE.md"
 
-def run_command(cmd, description):
-    """Run a command and show the results"""
+
+class ExtractorWorker:
+    """A single long-lived interpreter that runs code_extractor commands.
+
+    Spawning ``python code_extractor.py`` per example pays interpreter startup
+    and the extractor import every time; the worker pays it once.
+    """
+
+    def __init__(self):
+        self.process = subprocess.Popen(
+            [sys.executable, "-u", "_extractor_worker.py"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            cwd=HERE,
+        )
+
+    def run(self, args):
+        """Run code_extractor with the given argv and return its captured result"""
+        self.process.stdin.write(json.dumps({"argv": args}) + "\n")
+        self.process.stdin.flush()
+        line = self.process.stdout.readline()
+        if not line:
+            raise RuntimeError("extractor worker exited unexpectedly")
+        return json.loads(line)
+
+    def close(self):
+        if self.process.poll() is None:
+            self.process.stdin.close()
+            self.process.wait()
+
+
+_worker = None
+
+
+def get_worker():
+    """Start the shared extractor worker on first use"""
+    global _worker
+    if _worker is None:
+        _worker = ExtractorWorker()
+        atexit.register(_worker.close)
+    return _worker
+
+
+def run_command(args, description):
+    """Run code_extractor with the given arguments and show the results"""
     print(f"\n🚀 {description}")
-    print(f"💻 Command: {cmd}")
+    print(f"💻 Command: python code_extractor.py {shlex.join(args)}")
     print("-" * 60)
 
     try:
-        result = subprocess.run(
-            cmd, shell=True, capture_output=True, text=True, cwd=Path(__file__).parent
-        )
+        result = get_worker().run(args)
 
-        if result.stdout:
-            print(result.stdout)
+        if result["stdout"]:
+            print(result["stdout"])
 
-        if result.stderr and result.returncode != 0:
-            print(f"❌ Error: {result.stderr}")
+        if result["stderr"] and result["returncode"] != 0:
+            print(f"❌ Error: {result['stderr']}")
 
-        print(f"✅ Exit code: {result.returncode}")
+        print(f"✅ Exit code: {result['returncode']}")
 
     except Exception as e:
         print(f"❌ Failed to run command: {e}")
@@ -37,7 +84,7 @@ def run_command(cmd, description):
 def main():
     """Demonstrate various command-line usage patterns"""
 
-    guide_path = Path(__file__).parent / "EXTRACTOR_USAGE_GUIDE.md"
+    guide_path = GUIDE_PATH
 
     if not guide_path.exists():
         print("❌ EXTRACTOR_USAGE_GUIDE.md not found!")
@@ -49,67 +96,92 @@ def main():
 
     # Example 1: Basic extraction
     run_command(
-        f'python code_extractor.py "{guide_path}"',
+        [str(guide_path)],
         "Basic extraction - save all code blocks as individual files",
     )
 
     # Example 2: Extract with statistics
     run_command(
-        f'python code_extractor.py "{guide_path}" --stats',
+        [str(guide_path), "--stats"],
         "Show detailed statistics about extracted code",
     )
 
     # Example 3: Filter by language
     run_command(
-        f'python code_extractor.py "{guide_path}" --language python --stats',
+        [str(guide_path), "--language", "python", "--stats"],
         "Extract only Python code blocks",
     )
 
     # Example 4: High confidence filtering
     run_command(
-        f'python code_extractor.py "{guide_path}" --min-confidence 0.9 --stats',
+        [str(guide_path), "--min-confidence", "0.9", "--stats"],
         "Extract only high-confidence code blocks (≥0.9)",
     )
 
     # Example 5: Export as JSON
     run_command(
-        f'python code_extractor.py "{guide_path}" --format json --output usage_guide_codes.json',
+        [str(guide_path), "--format", "json", "--output", "usage_guide_codes.json"],
         "Export all code blocks as JSON",
     )
 
     # Example 6: Export as CSV
     run_command(
-        f'python code_extractor.py "{guide_path}" --format csv --output usage_guide_codes.csv',
+        [str(guide_path), "--format", "csv", "--output", "usage_guide_codes.csv"],
         "Export code blocks as CSV for analysis",
     )
 
     # Example 7: Filter by content length
     run_command(
-        f'python code_extractor.py "{guide_path}" --min-length 50 --stats',
+        [str(guide_path), "--min-length", "50", "--stats"],
         "Extract only substantial code blocks (≥50 characters)",
     )
 
     # Example 8: Filter by content containing specific text
     run_command(
-        f'python code_extractor.py "{guide_path}" --contains "import" --stats',
+        [str(guide_path), "--contains", "import", "--stats"],
         "Extract code blocks containing 'import'",
     )
 
     # Example 9: Combine multiple filters
     run_command(
-        f'python code_extractor.py "{guide_path}" --language python --min-confidence 0.8 --min-length 30 --output premium_python',
+        [
+            str(guide_path),
+            "--language",
+            "python",
+            "--min-confidence",
+            "0.8",
+            "--min-length",
+            "30",
+            "--output",
+            "premium_python",
+        ],
         "Premium Python code: high confidence + substantial size",
     )
 
     # Example 10: Debug mode with specific patterns
     run_command(
-        f'python code_extractor.py "{guide_path}" --patterns triple_backtick single_backtick --log-level DEBUG --stats',
+        [
+            str(guide_path),
+            "--patterns",
+            "triple_backtick",
+            "single_backtick",
+            "--log-level",
+            "DEBUG",
+            "--stats",
+        ],
         "Debug mode with specific extraction patterns",
     )
 
     # Example 11: Quiet mode (errors only)
     run_command(
-        f'python code_extractor.py "{guide_path}" --quiet --format json --output quiet_extraction.json',
+        [
+            str(guide_path),
+            "--quiet",
+            "--format",
+            "json",
+            "--output",
+            "quiet_extraction.json",
+        ],
         "Quiet mode - suppress all output except errors",
     )
 
@@ -124,7 +196,7 @@ def main():
         "premium_python/",
         "quiet_extraction.json",
     ]:
-        for file in Path(__file__).parent.glob(pattern):
+        for file in HERE.glob(pattern):
             if file.is_file():
                 print(f"   📄 {file.name}")
             elif file.is_dir():
@@ -134,9 +206,7 @@ def main():
 
 def show_help():
     """Show the help for the code extractor"""
-    run_command(
-        "python code_extractor.py --help", "Code Extractor Help - All available options"
-    )
+    run_command(["--help"], "Code Extractor Help - All available options")
 
 
 if __name__ == "__main__":
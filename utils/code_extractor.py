@@ -11,19 +11,38 @@ import xml.etree.ElementTree as ET
 import logging
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Union, Tuple, Iterator
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from abc import ABC, abstractmethod
 import argparse
-import mimetypes
-from urllib.parse import urlparse
-import base64
-
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from html.parser import HTMLParser
+
+try:
+    import orjson
+except ImportError:  # Optional C parser; the stdlib json module is the fallback
+    orjson = None
+
+__all__ = [
+    "ExtractedCode",
+    "InputProcessor",
+    "JSONProcessor",
+    "TextProcessor",
+    "HTMLProcessor",
+    "MarkdownProcessor",
+    "XMLProcessor",
+    "GenericCodeExtractor",
+    "setup_logging",
+    "main",
+]
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedCode:
     """Represents an extracted code block with comprehensive metadata"""
 
@@ -37,9 +56,35 @@ class ExtractedCode:
 
     def __post_init__(self):
         """Validate and normalize data after initialization"""
-        self.content = self.content.strip()
-        self.language = self.language.lower()
         self.confidence = max(0.0, min(1.0, self.confidence))
+        self.content = self.content.strip()
+        # Small, heavily repeated vocabularies: intern so results share one
+        # object per value and equality checks short-circuit on identity
+        self.language = sys.intern(self.language.lower())
+        self.source_type = sys.intern(self.source_type)
+        self.extraction_method = sys.intern(self.extraction_method)
+
+
+# Routing probes for HTMLProcessor / MarkdownProcessor.can_process
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_MARKDOWN_RE = re.compile(r"`[^`]+`|^\s*#|^\s*\*|^\s*\d+\.", re.MULTILINE)
+
+
+def _json_loads(text: Union[str, bytes]) -> Any:
+    """Parse JSON with orjson when installed, falling back to the stdlib"""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass  # NaN/Infinity literals are only accepted by the stdlib parser
+    return json.loads(text)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
 
 
 class InputProcessor(ABC):
@@ -59,18 +104,32 @@ class InputProcessor(ABC):
 class JSONProcessor(InputProcessor):
     """Process JSON conversation data"""
 
+    def __init__(self):
+        # (source string, parsed value) from the last successful can_process,
+        # so routing and processing share a single parse
+        self._parsed: Optional[Tuple[str, Any]] = None
+
     def can_process(self, input_data: Any) -> bool:
         if isinstance(input_data, str):
-            try:
-                json.loads(input_data)
+            if self._parsed is not None and self._parsed[0] is input_data:
                 return True
-            except:
+            # Only strings that open like a JSON document are worth parsing
+            if input_data.lstrip()[:1] not in ("{", "["):
+                return False
+            try:
+                self._parsed = (input_data, _json_loads(input_data))
+            except (ValueError, RecursionError):
                 return False
+            return True
         return isinstance(input_data, (list, dict))
 
     def process(self, input_data: Any) -> List[Dict[str, Any]]:
         if isinstance(input_data, str):
-            data = json.loads(input_data)
+            parsed, self._parsed = self._parsed, None
+            if parsed is not None and parsed[0] is input_data:
+                data = parsed[1]
+            else:
+                data = _json_loads(input_data)
         else:
             data = input_data
 
@@ -103,26 +162,28 @@ class JSONProcessor(InputProcessor):
 
     def _extract_text_from_message(self, message: Dict) -> str:
         """Extract text content from various message formats"""
-        if "content" in message:
-            content = message["content"]
-            if isinstance(content, str):
-                return content
-            elif isinstance(content, list):
-                text_parts = []
-                for item in content:
-                    if isinstance(item, dict):
-                        if item.get("type") == "text":
-                            text_parts.append(item.get("text", ""))
-                        elif "text" in item:
-                            text_parts.append(item["text"])
-                    elif isinstance(item, str):
-                        text_parts.append(item)
-                return "\n".join(text_parts)
+        # Plain string content is by far the most common chat format
+        content = message.get("content")
+        if isinstance(content, str):
+            return content
+        if isinstance(content, list):
+            text_parts = []
+            append = text_parts.append
+            for item in content:
+                if isinstance(item, dict):
+                    if item.get("type") == "text":
+                        append(item.get("text", ""))
+                    elif "text" in item:
+                        append(item["text"])
+                elif isinstance(item, str):
+                    append(item)
+            return "\n".join(text_parts)
 
         # Try other common fields
-        for field in ["text", "message", "body", "description"]:
-            if field in message and isinstance(message[field], str):
-                return message[field]
+        for field in ("text", "message", "body", "description"):
+            value = message.get(field)
+            if isinstance(value, str):
+                return value
 
         return ""
 
@@ -137,42 +198,102 @@ class TextProcessor(InputProcessor):
         return [{"text": input_data, "context": {"source": "plain_text"}}]
 
 
+class _HTMLBlockParser(HTMLParser):
+    """Collects code-bearing element bodies and plain text in one parse"""
+
+    # tag -> tag_type reported in the block context, in output order
+    CODE_TAGS = {
+        "code": "html_code",
+        "pre": "html_pre",
+        "script": "javascript",
+        "style": "css",
+    }
+
+    def __init__(self, source: str):
+        super().__init__(convert_charrefs=True)
+        self.source = source
+        self.blocks: Dict[str, List[Dict[str, Any]]] = {
+            tag: [] for tag in self.CODE_TAGS
+        }
+        self.text_parts: List[str] = []
+        # (tag, element start, body start) for each open code-bearing element
+        self._open: List[Tuple[str, int, int]] = []
+        # Absolute offset of each line start, for turning getpos() into indexes
+        self._line_starts = [0]
+        find = source.find
+        pos = find("\n")
+        while pos != -1:
+            self._line_starts.append(pos + 1)
+            pos = find("\n", pos + 1)
+
+    def _offset(self) -> int:
+        lineno, col = self.getpos()
+        return self._line_starts[lineno - 1] + col
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.CODE_TAGS:
+            start = self._offset()
+            self._open.append((tag, start, start + len(self.get_starttag_text())))
+
+    def handle_endtag(self, tag):
+        if tag not in self.CODE_TAGS:
+            return
+        for i in range(len(self._open) - 1, -1, -1):
+            if self._open[i][0] == tag:
+                _, start, body_start = self._open.pop(i)
+                body_end = self._offset()
+                end = self.source.find(">", body_end) + 1
+                # The raw body, markup included, so a <code> nested in a
+                # <pre> is still found when the <pre> body is scanned
+                self.blocks[tag].append(
+                    {
+                        "text": self.source[body_start:body_end],
+                        "start_pos": start,
+                        "end_pos": end,
+                    }
+                )
+                break
+
+    def handle_data(self, data):
+        self.text_parts.append(data)
+
+
 class HTMLProcessor(InputProcessor):
     """Process HTML content"""
 
     def can_process(self, input_data: Any) -> bool:
         if isinstance(input_data, str):
-            return bool(re.search(r"<[^>]+>", input_data))
+            # Substring checks rule out most plain text before the regex runs
+            if "<" not in input_data or ">" not in input_data:
+                return False
+            return _HTML_TAG_RE.search(input_data) is not None
         return False
 
     def process(self, input_data: Any) -> List[Dict[str, Any]]:
         texts = []
 
-        # Extract text from code tags
-        code_patterns = [
-            (r"<code[^>]*>(.*?)</code>", "html_code"),
-            (r"<pre[^>]*>(.*?)</pre>", "html_pre"),
-            (r"<script[^>]*>(.*?)</script>", "javascript"),
-            (r"<style[^>]*>(.*?)</style>", "css"),
-        ]
+        # Single pass collecting <code>, <pre>, <script> and <style> bodies
+        # alongside the document's plain text
+        parser = _HTMLBlockParser(input_data)
+        parser.feed(input_data)
+        parser.close()
 
-        for pattern, tag_type in code_patterns:
-            matches = re.finditer(pattern, input_data, re.DOTALL | re.IGNORECASE)
-            for idx, match in enumerate(matches):
+        for tag, tag_type in parser.CODE_TAGS.items():
+            for idx, block in enumerate(parser.blocks[tag]):
                 texts.append(
                     {
-                        "text": match.group(1),
+                        "text": block["text"],
                         "context": {
                             "tag_type": tag_type,
                             "match_index": idx,
-                            "start_pos": match.start(),
-                            "end_pos": match.end(),
+                            "start_pos": block["start_pos"],
+                            "end_pos": block["end_pos"],
                         },
                     }
                 )
 
         # Also extract plain text content
-        text_content = re.sub(r"<[^>]+>", "", input_data)
+        text_content = "".join(parser.text_parts)
         if text_content.strip():
             texts.append({"text": text_content, "context": {"source": "html_text"}})
 
@@ -184,24 +305,71 @@ class MarkdownProcessor(InputProcessor):
 
     def can_process(self, input_data: Any) -> bool:
         if isinstance(input_data, str):
-            # Check for markdown patterns
-            md_patterns = [r"```", r"`[^`]+`", r"^\s*#", r"^\s*\*", r"^\s*\d+\."]
-            return any(
-                re.search(pattern, input_data, re.MULTILINE) for pattern in md_patterns
-            )
+            # Fenced code is the common marker and needs no regex
+            if "```" in input_data:
+                return True
+            # Inline code, headings and list items
+            return _MARKDOWN_RE.search(input_data) is not None
         return False
 
     def process(self, input_data: Any) -> List[Dict[str, Any]]:
         return [{"text": input_data, "context": {"source": "markdown"}}]
 
 
+class _XMLBlockCollector:
+    """XMLParser target gathering code-tag texts and all text in one pass"""
+
+    def __init__(self, code_tags: Tuple[str, ...]):
+        self.blocks: Dict[str, List[Dict[str, Any]]] = {tag: [] for tag in code_tags}
+        self.text_parts: List[str] = []
+        # One [block, still_in_leading_text] entry per open element
+        self._stack: List[List[Any]] = []
+
+    def start(self, tag, attrib):
+        block = None
+        if self._stack:
+            # An element's .text stops at its first child
+            self._stack[-1][1] = False
+            if tag in self.blocks:
+                block = {"text_parts": [], "attributes": attrib}
+                self.blocks[tag].append(block)
+        self._stack.append([block, True])
+
+    def end(self, tag):
+        self._stack.pop()
+
+    def data(self, data):
+        self.text_parts.append(data)
+        if self._stack:
+            block, leading = self._stack[-1]
+            if block is not None and leading:
+                block["text_parts"].append(data)
+
+    def close(self):
+        return self
+
+
 class XMLProcessor(InputProcessor):
     """Process XML content"""
 
+    # Tags that might contain code
+    CODE_TAGS = ("code", "script", "query", "command", "example")
+
+    def __init__(self):
+        # (source string, collector) from the last successful can_process
+        self._parsed: Optional[Tuple[str, _XMLBlockCollector]] = None
+
+    def _collect(self, input_data: str) -> _XMLBlockCollector:
+        parser = ET.XMLParser(target=_XMLBlockCollector(self.CODE_TAGS))
+        parser.feed(input_data)
+        return parser.close()
+
     def can_process(self, input_data: Any) -> bool:
         if isinstance(input_data, str):
+            if not input_data.lstrip().startswith("<"):
+                return False
             try:
-                ET.fromstring(input_data)
+                self._parsed = (input_data, self._collect(input_data))
                 return True
             except:
                 return False
@@ -210,27 +378,29 @@ class XMLProcessor(InputProcessor):
     def process(self, input_data: Any) -> List[Dict[str, Any]]:
         texts = []
         try:
-            root = ET.fromstring(input_data)
-
-            # Extract text from specific tags that might contain code
-            code_tags = ["code", "script", "query", "command", "example"]
-            for tag in code_tags:
-                elements = root.findall(f".//{tag}")
-                for idx, elem in enumerate(elements):
-                    if elem.text:
+            parsed, self._parsed = self._parsed, None
+            if parsed is not None and parsed[0] is input_data:
+                collector = parsed[1]
+            else:
+                collector = self._collect(input_data)
+
+            for tag in self.CODE_TAGS:
+                for idx, block in enumerate(collector.blocks[tag]):
+                    text = "".join(block["text_parts"])
+                    if text:
                         texts.append(
                             {
-                                "text": elem.text,
+                                "text": text,
                                 "context": {
                                     "xml_tag": tag,
                                     "element_index": idx,
-                                    "attributes": elem.attrib,
+                                    "attributes": block["attributes"],
                                 },
                             }
                         )
 
             # Extract all text content as fallback
-            all_text = "".join(root.itertext())
+            all_text = "".join(collector.text_parts)
             if all_text.strip():
                 texts.append({"text": all_text, "context": {"source": "xml_all_text"}})
 
@@ -246,9 +416,101 @@ class XMLProcessor(InputProcessor):
         return texts
 
 
+# File extension used when exporting each language as individual files
+_LANG_EXT: Dict[str, str] = {
+    "python": ".py",
+    "py": ".py",
+    "javascript": ".js",
+    "js": ".js",
+    "typescript": ".ts",
+    "ts": ".ts",
+    "html": ".html",
+    "css": ".css",
+    "svg": ".svg",
+    "xml": ".xml",
+    "json": ".json",
+    "yaml": ".yaml",
+    "sql": ".sql",
+    "bash": ".sh",
+    "powershell": ".ps1",
+    "c": ".c",
+    "cpp": ".cpp",
+    "java": ".java",
+    "csharp": ".cs",
+    "cs": ".cs",
+    "php": ".php",
+    "ruby": ".rb",
+    "go": ".go",
+    "rust": ".rs",
+    "swift": ".swift",
+    "kotlin": ".kt",
+    "scala": ".scala",
+    "r": ".r",
+    "matlab": ".m",
+    "dockerfile": ".dockerfile",
+    "makefile": ".makefile",
+}
+
+# Most file writes kept in flight at once by export(output_format="files")
+_EXPORT_WRITE_BATCH = 32
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create ``path`` (and parents) if it does not exist"""
+    try:
+        # Usually only the last component is missing, so try it alone first
+        os.mkdir(path)
+    except FileExistsError:
+        pass
+    except FileNotFoundError:
+        path.mkdir(parents=True, exist_ok=True)
+
+
+# Extractor used by process-pool workers, installed once per worker process
+_worker_extractor: Optional["GenericCodeExtractor"] = None
+
+
+def _init_extraction_worker(extractor: "GenericCodeExtractor") -> None:
+    global _worker_extractor
+    _worker_extractor = extractor
+
+
+def _extract_block_in_worker(
+    text_block: Dict[str, Any],
+    source_type: str,
+    patterns: Optional[List[str]],
+    min_confidence: float,
+) -> List[ExtractedCode]:
+    return list(
+        _worker_extractor._extract_from_text_block(
+            text_block, source_type, patterns, min_confidence
+        )
+    )
+
+
+def _gil_disabled() -> bool:
+    """True on free-threaded builds running without the GIL"""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
 class GenericCodeExtractor:
     """Comprehensive code extractor with advanced strategies"""
 
+    # Names of the built-in extraction_patterns, available without an instance
+    PATTERN_NAMES: Tuple[str, ...] = (
+        "triple_backtick",
+        "single_backtick",
+        "indented_code",
+        "fenced_tilde",
+        "html_code",
+        "html_pre",
+        "script_tag",
+        "style_tag",
+        "heredoc",
+        "language_comment",
+    )
+
     def __init__(self):
         self.processors = [
             JSONProcessor(),
@@ -260,67 +522,99 @@ class GenericCodeExtractor:
 
         self.extraction_patterns = {
             "triple_backtick": {
-                "pattern": r"```(\w+)?\s*\n?(.*?)\n?```",
+                "pattern": r"```(\w++)?\s*+\n?(.*?)\n?```",
                 "confidence": 0.95,
                 "flags": re.DOTALL,
+                "marker": "```",
                 "groups": {"language": 1, "content": 2},
             },
             "single_backtick": {
                 "pattern": r"`([^`\n]+)`",
                 "confidence": 0.8,
                 "flags": 0,
+                "marker": "`",
                 "groups": {"content": 1},
             },
             "indented_code": {
                 "pattern": r"(?:^|\n)((?:    .+(?:\n|$))+)",
                 "confidence": 0.7,
                 "flags": re.MULTILINE,
+                "marker": "    ",
                 "groups": {"content": 1},
             },
             "fenced_tilde": {
-                "pattern": r"~~~(\w+)?\s*\n?(.*?)\n?~~~",
+                "pattern": r"~~~(\w++)?\s*+\n?(.*?)\n?~~~",
                 "confidence": 0.9,
                 "flags": re.DOTALL,
+                "marker": "~~~",
                 "groups": {"language": 1, "content": 2},
             },
             "html_code": {
-                "pattern": r"<code[^>]*>(.*?)</code>",
+                "pattern": r"<code[^>]*+>(.*?)</code>",
                 "confidence": 0.85,
                 "flags": re.DOTALL | re.IGNORECASE,
+                "marker": "<code",
                 "groups": {"content": 1},
             },
             "html_pre": {
-                "pattern": r"<pre[^>]*>(.*?)</pre>",
+                "pattern": r"<pre[^>]*+>(.*?)</pre>",
                 "confidence": 0.85,
                 "flags": re.DOTALL | re.IGNORECASE,
+                "marker": "<pre",
                 "groups": {"content": 1},
             },
             "script_tag": {
-                "pattern": r'<script[^>]*type=["\']([^"\']+)["\'][^>]*>(.*?)</script>',
+                "pattern": r'<script[^>]*type=["\']([^"\']++)["\'][^>]*+>(.*?)</script>',
                 "confidence": 0.9,
                 "flags": re.DOTALL | re.IGNORECASE,
+                "marker": "<script",
                 "groups": {"language": 1, "content": 2},
             },
             "style_tag": {
-                "pattern": r"<style[^>]*>(.*?)</style>",
+                "pattern": r"<style[^>]*+>(.*?)</style>",
                 "confidence": 0.9,
                 "flags": re.DOTALL | re.IGNORECASE,
+                "marker": "<style",
                 "groups": {"content": 1},
             },
             "heredoc": {
-                "pattern": r"<<(\w+)\s*\n(.*?)\n\1",
+                "pattern": r"<<(\w++)\s*\n(.*?)\n\1",
                 "confidence": 0.8,
                 "flags": re.DOTALL,
+                "marker": "<<",
                 "groups": {"language": 1, "content": 2},
             },
             "language_comment": {
-                "pattern": r"(?:^|\n)\s*(?://|#|--)\s*(?:lang|language):\s*(\w+)\s*\n((?:(?!(?:^|\n)\s*(?://|#|--)).)*)",
+                "pattern": r"(?:^|\n)\s*+(?://|#|--)\s*+(?:lang|language):\s*+(\w++)\s*\n((?:(?!(?:^|\n)\s*(?://|#|--)).)*)",
                 "confidence": 0.85,
                 "flags": re.MULTILINE | re.DOTALL,
+                "marker": "lang",
                 "groups": {"language": 1, "content": 2},
             },
         }
 
+        # Each "marker" is a literal every match of its pattern contains
+        # (case-folded for IGNORECASE patterns); blocks lacking it skip the scan
+
+        # Extraction regexes are compiled on first use, so runs restricted to a
+        # few patterns never pay for the others
+        self._compiled_patterns: Dict[str, re.Pattern] = {}
+
+        # Fold each extraction method's reliability into its base confidence
+        method_adjustments = {
+            "triple_backtick": 1.0,
+            "fenced_tilde": 1.0,
+            "script_tag": 1.0,
+            "html_code": 0.95,
+            "single_backtick": 0.8,
+            "indented_code": 0.7,
+            "language_comment": 0.9,
+        }
+        for name, info in self.extraction_patterns.items():
+            info["effective_confidence"] = info["confidence"] * method_adjustments.get(
+                name, 1.0
+            )
+
         # Language detection patterns
         self.language_patterns = {
             "python": [
@@ -396,6 +690,17 @@ class GenericCodeExtractor:
             "dockerfile": [r"\bFROM\s+", r"\bRUN\s+", r"\bCOPY\s+", r"Dockerfile"],
             "makefile": [r"^\w+:", r"\$\(.*\)", r"Makefile"],
         }
+        # Compiled once here rather than looked up in re's cache on every
+        # _detect_language call. Each pattern is counted separately: a single
+        # alternation cannot see overlapping matches (e.g. css brace bodies
+        # would swallow the rust/kotlin keywords inside them)
+        self._compiled_language_patterns = {
+            lang: [re.compile(p, re.IGNORECASE | re.MULTILINE) for p in patterns]
+            for lang, patterns in self.language_patterns.items()
+        }
+        # Per-extract() memo of content -> detected language; the same block is
+        # often matched by several patterns and scored twice per match
+        self._language_cache: Dict[str, Optional[str]] = {}
 
     def extract(
         self,
@@ -403,6 +708,7 @@ class GenericCodeExtractor:
         source_type: Optional[str] = None,
         patterns: Optional[List[str]] = None,
         min_confidence: float = 0.0,
+        workers: int = 1,
     ) -> List[ExtractedCode]:
         """
         Extract code from any input type
@@ -412,51 +718,116 @@ class GenericCodeExtractor:
             source_type: Override source type detection
             patterns: List of extraction patterns to use (None for all)
             min_confidence: Minimum confidence threshold for results
+            workers: Scan text blocks in parallel across this many workers
 
         Returns:
             List of ExtractedCode objects
         """
+        extracted_codes = list(
+            self.extract_iter(
+                input_data, source_type, patterns, min_confidence, workers
+            )
+        )
+        logger.debug(f"Extraction complete. Found {len(extracted_codes)} code blocks")
+        return extracted_codes
+
+    def extract_iter(
+        self,
+        input_data: Any,
+        source_type: Optional[str] = None,
+        patterns: Optional[List[str]] = None,
+        min_confidence: float = 0.0,
+        workers: int = 1,
+    ) -> Iterator[ExtractedCode]:
+        """
+        Lazily extract code from any input type
+
+        Same arguments as extract(), but yields each ExtractedCode as it is
+        found instead of materializing the full result list.
+        """
         logger.debug(
             f"Starting extraction with source_type={source_type}, patterns={patterns}, min_confidence={min_confidence}"
         )
 
-        # Determine source type
+        self._language_cache.clear()
+
+        # Pick the processor once; its name doubles as the detected source type
+        detected_type, processor = self._route(input_data)
         if source_type is None:
-            source_type = self._detect_source_type(input_data)
+            source_type = detected_type
 
         logger.debug(f"Detected source type: {source_type}")
 
         # Process input to get text blocks
-        text_blocks = self._process_input(input_data, source_type)
+        if processor is not None:
+            text_blocks = processor.process(input_data)
+        else:
+            text_blocks = [{"text": str(input_data), "context": {"source": "fallback"}}]
         logger.debug(f"Found {len(text_blocks)} text blocks to process")
 
+        # Regex scanning is CPU-bound and blocks are independent, so large
+        # inputs can fan out; small ones aren't worth the pool start-up cost
+        if workers > 1 and len(text_blocks) > workers:
+            yield from self._extract_parallel(
+                text_blocks, source_type, patterns, min_confidence, workers
+            )
+            return
+
         # Extract code from each text block
-        extracted_codes = []
         for i, text_block in enumerate(text_blocks):
             logger.debug(f"Processing text block {i+1}/{len(text_blocks)}")
-            codes = self._extract_from_text_block(
+            yield from self._extract_from_text_block(
                 text_block, source_type, patterns, min_confidence
             )
-            extracted_codes.extend(codes)
 
-        logger.debug(f"Extraction complete. Found {len(extracted_codes)} code blocks")
-        return extracted_codes
-
-    def _detect_source_type(self, input_data: Any) -> str:
-        """Detect the source type of input data"""
-        for processor in self.processors:
-            if processor.can_process(input_data):
-                return processor.__class__.__name__.replace("Processor", "").lower()
-        return "unknown"
+    def _extract_parallel(
+        self,
+        text_blocks: List[Dict[str, Any]],
+        source_type: str,
+        patterns: Optional[List[str]],
+        min_confidence: float,
+        workers: int,
+    ) -> Iterator[ExtractedCode]:
+        """Extract from text blocks across a worker pool, keeping block order"""
+        logger.debug(
+            f"Extracting {len(text_blocks)} text blocks with {workers} workers"
+        )
+        args = (
+            text_blocks,
+            repeat(source_type),
+            repeat(patterns),
+            repeat(min_confidence),
+        )
 
-    def _process_input(self, input_data: Any, source_type: str) -> List[Dict[str, Any]]:
-        """Process input using appropriate processor"""
+        if _gil_disabled():
+            # Free-threaded build: threads scan in parallel with no pickling
+            def extract_block(*block_args):
+                return list(self._extract_from_text_block(*block_args))
+
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for codes in pool.map(extract_block, *args):
+                    yield from codes
+            return
+
+        # Imported here: it pulls in multiprocessing, which plain runs never need
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunksize = max(1, len(text_blocks) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_extraction_worker,
+            initargs=(self,),
+        ) as pool:
+            for codes in pool.map(_extract_block_in_worker, *args, chunksize=chunksize):
+                yield from codes
+
+    def _route(self, input_data: Any) -> Tuple[str, Optional[InputProcessor]]:
+        """Find the first processor that accepts the input, with its source type"""
         for processor in self.processors:
             if processor.can_process(input_data):
-                return processor.process(input_data)
-
-        # Fallback
-        return [{"text": str(input_data), "context": {"source": "fallback"}}]
+                source_type = processor.__class__.__name__.replace("Processor", "")
+                return source_type.lower(), processor
+        return "unknown", None
 
     def _extract_from_text_block(
         self,
@@ -464,160 +835,157 @@ class GenericCodeExtractor:
         source_type: str,
         patterns: Optional[List[str]] = None,
         min_confidence: float = 0.0,
-    ) -> List[ExtractedCode]:
+    ) -> Iterator[ExtractedCode]:
         """Extract code from a single text block"""
         text = text_block["text"]
         context = text_block["context"]
+        text_len = len(text)
 
-        logger.debug(f"Extracting from text block with {len(text)} characters")
+        logger.debug(f"Extracting from text block with {text_len} characters")
 
         if patterns is None:
             patterns = list(self.extraction_patterns.keys())
 
-        extracted_codes = []
+        # Bind per-call constants once; the match loop below is the hot path
+        debug = logger.isEnabledFor(logging.DEBUG)
+        detect_language = self._detect_language
+        calculate_confidence = self._calculate_confidence
+        folded_text = None
 
         for pattern_name in patterns:
-            if pattern_name not in self.extraction_patterns:
+            pattern_info = self.extraction_patterns.get(pattern_name)
+            if pattern_info is None:
                 logger.warning(f"Unknown pattern: {pattern_name}")
                 continue
 
-            pattern_info = self.extraction_patterns[pattern_name]
-            pattern = pattern_info["pattern"]
-            base_confidence = pattern_info["confidence"]
-            flags = pattern_info.get("flags", 0)
+            base_confidence = pattern_info["effective_confidence"]
             groups = pattern_info["groups"]
+            content_group = groups.get("content")
+            language_group = groups.get("language")
 
-            matches = re.finditer(pattern, text, flags)
-
-            for match_idx, match in enumerate(matches):
-                try:
-                    # Extract content and language
-                    content = ""
-                    language = "text"
-
-                    if "content" in groups:
-                        content = match.group(groups["content"])
-
-                    if "language" in groups and match.group(groups["language"]):
-                        language = match.group(groups["language"])
-                    else:
-                        # Try to detect language from content
-                        detected_lang = self._detect_language(content)
-                        if detected_lang:
-                            language = detected_lang
-
-                    # Skip empty content
-                    if not content or not content.strip():
+            # A substring probe is far cheaper than a full regex scan
+            flags = pattern_info.get("flags", 0)
+            marker = pattern_info.get("marker")
+            if marker is not None:
+                if flags & re.IGNORECASE:
+                    if folded_text is None:
+                        folded_text = text.lower()
+                    if marker not in folded_text:
                         continue
+                elif marker not in text:
+                    continue
 
-                    # Calculate confidence
-                    confidence = self._calculate_confidence(
-                        content, language, pattern_name, base_confidence
+            compiled = self._compiled_patterns.get(pattern_name)
+            if compiled is None:
+                compiled = self._compiled_patterns[pattern_name] = re.compile(
+                    pattern_info["pattern"], flags
+                )
+
+            for match_idx, match in enumerate(compiled.finditer(text)):
+                try:
+                    content = match.group(content_group) if content_group else ""
+                    group_language = (
+                        match.group(language_group) if language_group else None
                     )
+                except IndexError as e:
+                    # Log error but continue processing
+                    logger.error(
+                        f"Error processing match with pattern {pattern_name}: {e}"
+                    )
+                    continue
+
+                # Skip empty content
+                if not content or not content.strip():
+                    continue
+
+                detected_lang = detect_language(content)
+                language = group_language or detected_lang or "text"
 
-                    if confidence < min_confidence:
+                confidence = calculate_confidence(
+                    content, language, base_confidence, detected_lang=detected_lang
+                )
+
+                if confidence < min_confidence:
+                    if debug:
                         logger.debug(
                             f"Skipping match with confidence {confidence:.3f} < {min_confidence}"
                         )
-                        continue
-
-                    # Create metadata
-                    metadata = {
-                        "match_index": match_idx,
-                        "start_pos": match.start(),
-                        "end_pos": match.end(),
-                        "original_length": len(text),
-                        "extracted_length": len(content),
-                    }
+                    continue
 
-                    # Merge context
-                    full_context = {**context, **metadata}
+                metadata = {
+                    "match_index": match_idx,
+                    "start_pos": match.start(),
+                    "end_pos": match.end(),
+                    "original_length": text_len,
+                    "extracted_length": len(content),
+                }
 
+                if debug:
                     logger.debug(
                         f"Extracted {language} code block with confidence {confidence:.3f} using {pattern_name}"
                     )
 
-                    extracted_codes.append(
-                        ExtractedCode(
-                            content=content,
-                            language=language,
-                            source_type=source_type,
-                            extraction_method=pattern_name,
-                            confidence=confidence,
-                            context=full_context,
-                            metadata=metadata,
-                        )
-                    )
-
-                except Exception as e:
-                    # Log error but continue processing
-                    logger.error(
-                        f"Error processing match with pattern {pattern_name}: {e}"
-                    )
-                    continue
-
-        return extracted_codes
+                yield ExtractedCode(
+                    content=content,
+                    language=language,
+                    source_type=source_type,
+                    extraction_method=pattern_name,
+                    confidence=confidence,
+                    context={**context, **metadata},
+                    metadata=metadata,
+                )
 
     def _detect_language(self, content: str) -> Optional[str]:
         """Detect programming language from content"""
-        content_lower = content.lower()
+        try:
+            return self._language_cache[content]
+        except KeyError:
+            pass
 
         # Score each language
         language_scores = {}
-        for lang, patterns in self.language_patterns.items():
-            score = 0
-            for pattern in patterns:
-                matches = len(
-                    re.findall(pattern, content, re.IGNORECASE | re.MULTILINE)
-                )
-                score += matches
-
+        for lang, patterns in self._compiled_language_patterns.items():
+            score = sum(len(pattern.findall(content)) for pattern in patterns)
             if score > 0:
                 language_scores[lang] = score
 
+        # Highest score wins, ties going to the earlier language
         if not language_scores:
-            return None
+            detected = None
+        else:
+            detected = max(language_scores, key=language_scores.get)
 
-        # Return language with highest score
-        return max(language_scores, key=language_scores.get)
+        self._language_cache[content] = detected
+        return detected
 
     def _calculate_confidence(
         self,
         content: str,
         language: str,
-        extraction_method: str,
         base_confidence: float,
+        detected_lang: Optional[str] = None,
     ) -> float:
-        """Calculate confidence score for extracted code"""
-        confidence = base_confidence
+        """Calculate confidence score for extracted code
 
-        # Adjust based on content characteristics
-        if len(content) < 10:
-            confidence *= 0.8  # Very short content is less reliable
-        elif len(content) > 1000:
-            confidence *= 1.1  # Longer content is more likely to be actual code
+        base_confidence is the pattern's effective confidence, which already
+        includes the extraction method's reliability adjustment.
+        """
+        # Adjust based on content characteristics: very short content is less
+        # reliable, longer content is more likely to be actual code
+        length = len(content)
+        confidence = base_confidence * (
+            0.8 if length < 10 else (1.1 if length > 1000 else 1.0)
+        )
 
         # Adjust based on language detection confidence
         if language != "text":
-            detected_lang = self._detect_language(content)
+            if detected_lang is None:
+                detected_lang = self._detect_language(content)
             if detected_lang == language:
                 confidence *= 1.1  # Language matches detection
             elif detected_lang:
                 confidence *= 0.9  # Different language detected
 
-        # Adjust based on extraction method reliability
-        method_adjustments = {
-            "triple_backtick": 1.0,
-            "fenced_tilde": 1.0,
-            "script_tag": 1.0,
-            "html_code": 0.95,
-            "single_backtick": 0.8,
-            "indented_code": 0.7,
-            "language_comment": 0.9,
-        }
-
-        confidence *= method_adjustments.get(extraction_method, 1.0)
-
         return min(1.0, max(0.0, confidence))
 
     def filter(
@@ -627,80 +995,47 @@ class GenericCodeExtractor:
         logger.debug(
             f"Filtering {len(extracted_codes)} codes with criteria: {criteria}"
         )
-        filtered = extracted_codes.copy()
+        # One predicate per criterion, cheapest first, applied in a single pass
+        predicates = []
 
-        # Filter by language
         if "language" in criteria:
             lang = criteria["language"].lower()
-            before_count = len(filtered)
-            filtered = [code for code in filtered if code.language == lang]
-            logger.debug(f"Language filter ({lang}): {before_count} -> {len(filtered)}")
+            predicates.append(lambda code: code.language == lang)
 
-        # Filter by source type
         if "source_type" in criteria:
             source = criteria["source_type"].lower()
-            before_count = len(filtered)
-            filtered = [code for code in filtered if code.source_type == source]
-            logger.debug(
-                f"Source type filter ({source}): {before_count} -> {len(filtered)}"
-            )
+            predicates.append(lambda code: code.source_type == source)
 
-        # Filter by extraction method
         if "extraction_method" in criteria:
             method = criteria["extraction_method"]
-            before_count = len(filtered)
-            filtered = [code for code in filtered if code.extraction_method == method]
-            logger.debug(
-                f"Extraction method filter ({method}): {before_count} -> {len(filtered)}"
-            )
+            predicates.append(lambda code: code.extraction_method == method)
 
-        # Filter by confidence threshold
         if "min_confidence" in criteria:
             min_conf = criteria["min_confidence"]
-            before_count = len(filtered)
-            filtered = [code for code in filtered if code.confidence >= min_conf]
-            logger.debug(
-                f"Min confidence filter ({min_conf}): {before_count} -> {len(filtered)}"
-            )
+            predicates.append(lambda code: code.confidence >= min_conf)
 
-        # Filter by content length
         if "min_length" in criteria:
             min_len = criteria["min_length"]
-            before_count = len(filtered)
-            filtered = [code for code in filtered if len(code.content) >= min_len]
-            logger.debug(
-                f"Min length filter ({min_len}): {before_count} -> {len(filtered)}"
-            )
+            predicates.append(lambda code: len(code.content) >= min_len)
 
         if "max_length" in criteria:
             max_len = criteria["max_length"]
-            before_count = len(filtered)
-            filtered = [code for code in filtered if len(code.content) <= max_len]
-            logger.debug(
-                f"Max length filter ({max_len}): {before_count} -> {len(filtered)}"
-            )
+            predicates.append(lambda code: len(code.content) <= max_len)
+
+        # Role lookup and case-folding allocate, so they run last
+        if "role" in criteria:
+            role = criteria["role"].lower()
+            predicates.append(lambda code: code.context.get("role", "").lower() == role)
 
-        # Filter by content contains
         if "contains" in criteria:
             search_term = criteria["contains"].lower()
-            before_count = len(filtered)
-            filtered = [
-                code for code in filtered if search_term in code.content.lower()
-            ]
-            logger.debug(
-                f"Contains filter ({search_term}): {before_count} -> {len(filtered)}"
-            )
+            predicates.append(lambda code: search_term in code.content.lower())
 
-        # Filter by role (if available in context)
-        if "role" in criteria:
-            role = criteria["role"].lower()
-            before_count = len(filtered)
-            filtered = [
-                code
-                for code in filtered
-                if code.context.get("role", "").lower() == role
-            ]
-            logger.debug(f"Role filter ({role}): {before_count} -> {len(filtered)}")
+        filtered = [
+            code
+            for code in extracted_codes
+            if all(predicate(code) for predicate in predicates)
+        ]
 
         logger.info(
             f"Filtering complete: {len(extracted_codes)} -> {len(filtered)} codes"
@@ -712,47 +1047,65 @@ class GenericCodeExtractor:
         if not extracted_codes:
             return {"total": 0}
 
+        by_language = Counter()
+        by_source_type = Counter()
+        by_extraction_method = Counter()
+        min_conf = max_conf = extracted_codes[0].confidence
+        min_len = max_len = len(extracted_codes[0].content)
+        sum_conf = 0.0
+        sum_len = high = medium = low = 0
+
+        # Single pass accumulating every statistic
+        for code in extracted_codes:
+            confidence = code.confidence
+            length = len(code.content)
+
+            sum_conf += confidence
+            if confidence < min_conf:
+                min_conf = confidence
+            elif confidence > max_conf:
+                max_conf = confidence
+
+            sum_len += length
+            if length < min_len:
+                min_len = length
+            elif length > max_len:
+                max_len = length
+
+            if confidence >= 0.9:
+                high += 1
+            elif confidence >= 0.7:
+                medium += 1
+            else:
+                low += 1
+
+            by_language[code.language] += 1
+            by_source_type[code.source_type] += 1
+            by_extraction_method[code.extraction_method] += 1
+
+        total = len(extracted_codes)
+        # Breakdowns come most common first so callers can print them directly
         stats = {
-            "total": len(extracted_codes),
-            "by_language": {},
-            "by_source_type": {},
-            "by_extraction_method": {},
+            "total": total,
+            "by_language": dict(by_language.most_common()),
+            "by_source_type": dict(by_source_type.most_common()),
+            "by_extraction_method": dict(by_extraction_method.most_common()),
             "confidence_stats": {
-                "min": min(code.confidence for code in extracted_codes),
-                "max": max(code.confidence for code in extracted_codes),
-                "avg": sum(code.confidence for code in extracted_codes)
-                / len(extracted_codes),
+                "min": min_conf,
+                "max": max_conf,
+                "avg": sum_conf / total,
             },
             "content_length": {
-                "min": min(len(code.content) for code in extracted_codes),
-                "max": max(len(code.content) for code in extracted_codes),
-                "avg": sum(len(code.content) for code in extracted_codes)
-                / len(extracted_codes),
-                "total": sum(len(code.content) for code in extracted_codes),
+                "min": min_len,
+                "max": max_len,
+                "avg": sum_len / total,
+                "total": sum_len,
             },
-            "high_confidence": len([c for c in extracted_codes if c.confidence >= 0.9]),
-            "medium_confidence": len(
-                [c for c in extracted_codes if 0.7 <= c.confidence < 0.9]
-            ),
-            "low_confidence": len([c for c in extracted_codes if c.confidence < 0.7]),
+            "high_confidence": high,
+            "medium_confidence": medium,
+            "low_confidence": low,
         }
 
-        # Count by categories
-        for code in extracted_codes:
-            # By language
-            lang = code.language
-            stats["by_language"][lang] = stats["by_language"].get(lang, 0) + 1
-
-            # By source type
-            source = code.source_type
-            stats["by_source_type"][source] = stats["by_source_type"].get(source, 0) + 1
-
-            # By extraction method
-            method = code.extraction_method
-            stats["by_extraction_method"][method] = (
-                stats["by_extraction_method"].get(method, 0) + 1
-            )
-
         return stats
 
     def export(
@@ -761,22 +1114,41 @@ class GenericCodeExtractor:
         output_format: str,
         output_path: str,
         include_metadata: bool = True,
+        executor: Optional[ThreadPoolExecutor] = None,
     ):
-        """Export extracted codes to various formats"""
+        """Export extracted codes to various formats
+
+        ``executor`` lends a long-lived thread pool to the "files" format so
+        callers exporting repeatedly do not start a new pool each time.
+        """
         logger.info(
             f"Exporting {len(extracted_codes)} codes to {output_format} format at {output_path}"
         )
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        if output_format.lower() != "files":
+            _ensure_dir(Path(output_path).parent)
 
         if output_format.lower() == "json":
             logger.debug("Exporting as JSON")
-            data = [asdict(code) for code in extracted_codes]
-            if not include_metadata:
-                for item in data:
-                    item.pop("metadata", None)
-
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Stream the array one element at a time instead of building
+            # asdict() copies of every result up front
+            with open(output_path, "wb") as f:
+                f.write(b"[")
+                separator = b"\n"
+                for code in extracted_codes:
+                    item = {
+                        "content": code.content,
+                        "language": code.language,
+                        "source_type": code.source_type,
+                        "extraction_method": code.extraction_method,
+                        "confidence": code.confidence,
+                        "context": code.context,
+                    }
+                    if include_metadata:
+                        item["metadata"] = code.metadata
+                    f.write(separator)
+                    f.write(_json_dumps(item))
+                    separator = b",\n"
+                f.write(b"\n]" if extracted_codes else b"]")
 
         elif output_format.lower() == "csv":
             logger.debug("Exporting as CSV")
@@ -815,9 +1187,12 @@ class GenericCodeExtractor:
             logger.debug("Exporting as individual files")
             # Save as individual files
             output_dir = Path(output_path)
-            output_dir.mkdir(parents=True, exist_ok=True)
+            _ensure_dir(output_dir)
 
             language_counts = {}
+            # Blocks share a handful of confidence values, so format each once
+            confidence_names: Dict[float, str] = {}
+            file_paths = []
 
             for code in extracted_codes:
                 # Count for unique naming
@@ -828,170 +1203,155 @@ class GenericCodeExtractor:
                 ext = self._get_file_extension(lang)
 
                 # Create filename
-                confidence_str = f"{code.confidence:.2f}".replace(".", "_")
+                confidence_str = confidence_names.get(code.confidence)
+                if confidence_str is None:
+                    confidence_str = f"{code.confidence:.2f}".replace(".", "_")
+                    confidence_names[code.confidence] = confidence_str
                 filename = f"{lang}_{language_counts[lang]:03d}_{code.extraction_method}_{confidence_str}{ext}"
-
-                # Save file
-                file_path = output_dir / filename
-                with open(file_path, "w", encoding="utf-8") as f:
-                    if include_metadata:
-                        f.write(f"# Extracted from: {code.source_type}\n")
-                        f.write(f"# Method: {code.extraction_method}\n")
-                        f.write(f"# Confidence: {code.confidence:.3f}\n")
-                        f.write(f"# Language: {code.language}\n\n")
-                    f.write(code.content)
-
-                logger.info(f"Saved: {filename}")
+                file_paths.append(output_dir / filename)
+
+            # Each file costs several blocking syscalls that release the GIL,
+            # so keep a batch of them in flight; a single file skips the pool
+            if len(file_paths) > 1 and executor is not None:
+                for _ in executor.map(
+                    self._write_code_file,
+                    file_paths,
+                    extracted_codes,
+                    repeat(include_metadata),
+                ):
+                    pass
+            elif len(file_paths) > 1:
+                with ThreadPoolExecutor(
+                    max_workers=min(_EXPORT_WRITE_BATCH, len(file_paths))
+                ) as pool:
+                    for _ in pool.map(
+                        self._write_code_file,
+                        file_paths,
+                        extracted_codes,
+                        repeat(include_metadata),
+                    ):
+                        pass
+            else:
+                for file_path, code in zip(file_paths, extracted_codes):
+                    self._write_code_file(file_path, code, include_metadata)
+
+            for file_path in file_paths:
+                logger.info(f"Saved: {file_path.name}")
 
         else:
             raise ValueError(f"Unsupported output format: {output_format}")
 
         logger.info(f"Export completed successfully")
 
+    def _write_code_file(
+        self, file_path: Path, code: ExtractedCode, include_metadata: bool
+    ) -> None:
+        """Write one extracted block, optionally preceded by a metadata header"""
+        # Build the whole header in one go rather than line by line
+        header = (
+            f"# Extracted from: {code.source_type}\n"
+            f"# Method: {code.extraction_method}\n"
+            f"# Confidence: {code.confidence:.3f}\n"
+            f"# Language: {code.language}\n\n"
+            if include_metadata
+            else ""
+        )
+
+        if hasattr(os, "writev"):
+            # Hand the header and content to the kernel in one gathered write
+            # instead of going through the buffered text layer
+            iov = [header.encode("utf-8"), code.content.encode("utf-8")]
+            fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+            try:
+                total = len(iov[0]) + len(iov[1])
+                written = os.writev(fd, iov)
+                if written < total:
+                    # Short write: finish off whatever is left
+                    rest = memoryview(b"".join(iov))[written:]
+                    while rest:
+                        rest = rest[os.write(fd, rest) :]
+            finally:
+                os.close(fd)
+            return
+
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(header + code.content)
+
     def _get_file_extension(self, language: str) -> str:
         """Get file extension for a programming language"""
-        extensions = {
-            "python": ".py",
-            "py": ".py",
-            "javascript": ".js",
-            "js": ".js",
-            "typescript": ".ts",
-            "ts": ".ts",
-            "html": ".html",
-            "css": ".css",
-            "svg": ".svg",
-            "xml": ".xml",
-            "json": ".json",
-            "yaml": ".yaml",
-            "sql": ".sql",
-            "bash": ".sh",
-            "powershell": ".ps1",
-            "c": ".c",
-            "cpp": ".cpp",
-            "java": ".java",
-            "csharp": ".cs",
-            "cs": ".cs",
-            "php": ".php",
-            "ruby": ".rb",
-            "go": ".go",
-            "rust": ".rs",
-            "swift": ".swift",
-            "kotlin": ".kt",
-            "scala": ".scala",
-            "r": ".r",
-            "matlab": ".m",
-            "dockerfile": ".dockerfile",
-            "makefile": ".makefile",
-        }
-        return extensions.get(language.lower(), ".txt")
+        # Extracted languages are already lowercase, so try them as-is first
+        ext = _LANG_EXT.get(language)
+        if ext is not None:
+            return ext
+        return _LANG_EXT.get(language.lower(), ".txt")
+
+
+# (level, format) last applied by setup_logging, with the handler it installed
+_logging_config: Optional[Tuple[int, str, logging.Handler]] = None
 
 
 def setup_logging(level: str = "INFO", format_string: Optional[str] = None) -> None:
     """Configure logging for the code extractor"""
+    global _logging_config
+
     if format_string is None:
         format_string = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    numeric_level = getattr(logging, level.upper())
+
+    # Repeated main() calls usually ask for the same setup; keep the existing
+    # handler instead of tearing it down and rebuilding it, unless stderr has
+    # been swapped since (e.g. redirect_stderr in the persistent worker)
+    root = logging.getLogger()
+    if (
+        _logging_config is not None
+        and _logging_config[:2] == (numeric_level, format_string)
+        and root.handlers == [_logging_config[2]]
+        and _logging_config[2].stream is sys.stderr
+        and root.level == numeric_level
+    ):
+        return
 
+    handler = logging.StreamHandler()  # Console output
     logging.basicConfig(
-        level=getattr(logging, level.upper()),
+        level=numeric_level,
         format=format_string,
-        handlers=[
-            logging.StreamHandler(),  # Console output
-        ],
-    )
-
-
-def main():
-    """Command line interface"""
-    parser = argparse.ArgumentParser(
-        description="Generic Code Extractor - Extract code from any input format"
-    )
-
-    # Input options
-    parser.add_argument("input", help="Input file or data")
-    parser.add_argument(
-        "--input-type",
-        choices=["auto", "json", "text", "html", "xml", "markdown"],
-        default="auto",
-        help="Input type (auto-detect if not specified)",
-    )
-
-    # Extraction options
-    parser.add_argument(
-        "--patterns",
-        nargs="+",
-        choices=list(GenericCodeExtractor().extraction_patterns.keys()),
-        help="Extraction patterns to use",
-    )
-    parser.add_argument(
-        "--min-confidence", type=float, default=0.0, help="Minimum confidence threshold"
-    )
-
-    # Filtering options
-    parser.add_argument("--language", help="Filter by programming language")
-    parser.add_argument("--source-type", help="Filter by source type")
-    parser.add_argument("--min-length", type=int, help="Minimum content length")
-    parser.add_argument("--max-length", type=int, help="Maximum content length")
-    parser.add_argument("--contains", help="Filter by content containing text")
-
-    # Output options
-    parser.add_argument("--output", default="extracted_code", help="Output path")
-    parser.add_argument(
-        "--format",
-        choices=["files", "json", "csv"],
-        default="files",
-        help="Output format",
+        handlers=[handler],
+        force=True,  # Reconfigure when main() runs repeatedly in one process
     )
-    parser.add_argument(
-        "--include-metadata",
-        action="store_true",
-        default=True,
-        help="Include metadata in output",
-    )
-    parser.add_argument("--stats", action="store_true", help="Show statistics")
+    _logging_config = (numeric_level, format_string, handler)
 
-    # Logging options
-    parser.add_argument(
-        "--log-level",
-        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
-        default="INFO",
-        help="Set the logging level",
-    )
-    parser.add_argument(
-        "--quiet", "-q", action="store_true", help="Suppress all output except errors"
-    )
-
-    args = parser.parse_args()
-
-    # Setup logging
-    log_level = "ERROR" if args.quiet else args.log_level
-    setup_logging(level=log_level)
-
-    # Create extractor
-    extractor = GenericCodeExtractor()
 
+def _process_input(
+    extractor: GenericCodeExtractor,
+    args: argparse.Namespace,
+    source: str,
+    executor: Optional[ThreadPoolExecutor] = None,
+) -> None:
+    """Read, extract, filter, report and export one CLI input"""
     # Read input
     try:
-        if os.path.isfile(args.input):
-            logger.debug(f"Reading input from file: {args.input}")
-            with open(args.input, "r", encoding="utf-8") as f:
+        if os.path.isfile(source):
+            logger.debug(f"Reading input from file: {source}")
+            # Keep the raw bytes: the JSON parser takes them directly, and
+            # only text input needs decoding
+            with open(source, "rb") as f:
                 input_data = f.read()
-                # Try to parse as JSON first
-                try:
-                    input_data = json.loads(input_data)
-                    logger.debug("Successfully parsed input as JSON")
-                except:
-                    logger.debug("Input is not valid JSON, treating as text")
-                    pass  # Keep as string
         else:
             # Treat as direct input
             logger.debug("Using direct input data")
-            input_data = args.input
+            input_data = source
+
+        # Try to parse as JSON first, but only if it opens like a document
+        if input_data.lstrip()[:1] in ("{", "[", b"{", b"["):
             try:
-                input_data = json.loads(input_data)
+                input_data = _json_loads(input_data)
                 logger.debug("Successfully parsed input as JSON")
-            except:
+            except (ValueError, RecursionError):
                 logger.debug("Input is not valid JSON, treating as text")
-                pass
+        else:
+            logger.debug("Input is not JSON, treating as text")
+        if isinstance(input_data, bytes):
+            input_data = input_data.decode("utf-8")
     except Exception as e:
         logger.error(f"Error reading input: {e}")
         return
@@ -1003,6 +1363,7 @@ def main():
         source_type=source_type,
         patterns=args.patterns,
         min_confidence=args.min_confidence,
+        workers=args.workers,
     )
 
     # Apply filters
@@ -1049,11 +1410,111 @@ def main():
             args.format,
             args.output,
             include_metadata=args.include_metadata,
+            executor=executor,
         )
         logger.info(f"Results exported to: {args.output}")
     else:
         logger.warning("No code blocks found with the specified criteria.")
 
 
+def main(argv: Optional[List[str]] = None):
+    """Command line interface"""
+    parser = argparse.ArgumentParser(
+        description="Generic Code Extractor - Extract code from any input format"
+    )
+
+    # Input options
+    parser.add_argument("input", nargs="?", help="Input file or data")
+    parser.add_argument(
+        "--input-type",
+        choices=["auto", "json", "text", "html", "xml", "markdown"],
+        default="auto",
+        help="Input type (auto-detect if not specified)",
+    )
+
+    # Extraction options
+    parser.add_argument(
+        "--patterns",
+        nargs="+",
+        choices=GenericCodeExtractor.PATTERN_NAMES,
+        help="Extraction patterns to use",
+    )
+    parser.add_argument(
+        "--min-confidence", type=float, default=0.0, help="Minimum confidence threshold"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Scan text blocks in parallel across this many processes",
+    )
+
+    # Filtering options
+    parser.add_argument("--language", help="Filter by programming language")
+    parser.add_argument("--source-type", help="Filter by source type")
+    parser.add_argument("--min-length", type=int, help="Minimum content length")
+    parser.add_argument("--max-length", type=int, help="Maximum content length")
+    parser.add_argument("--contains", help="Filter by content containing text")
+
+    # Output options
+    parser.add_argument("--output", default="extracted_code", help="Output path")
+    parser.add_argument(
+        "--format",
+        choices=["files", "json", "csv"],
+        default="files",
+        help="Output format",
+    )
+    parser.add_argument(
+        "--include-metadata",
+        action="store_true",
+        default=True,
+        help="Include metadata in output",
+    )
+    parser.add_argument("--stats", action="store_true", help="Show statistics")
+
+    # Logging options
+    parser.add_argument(
+        "--log-level",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        default="INFO",
+        help="Set the logging level",
+    )
+    parser.add_argument(
+        "--quiet", "-q", action="store_true", help="Suppress all output except errors"
+    )
+
+    # Batch options
+    parser.add_argument(
+        "--server",
+        action="store_true",
+        help="Read inputs (file paths or data) from stdin, one per line, "
+        "reusing one extractor for all of them",
+    )
+
+    args = parser.parse_args(argv)
+    if args.input is None and not args.server:
+        parser.error("the following arguments are required: input")
+
+    # Setup logging
+    log_level = "ERROR" if args.quiet else args.log_level
+    setup_logging(level=log_level)
+
+    # Create extractor
+    extractor = GenericCodeExtractor()
+
+    if not args.server:
+        _process_input(extractor, args, args.input)
+        return
+
+    # Keep the extractor (with its compiled patterns and caches) and one
+    # export thread pool alive for every input instead of rebuilding them
+    logger.debug("Server mode: reading inputs from stdin")
+    with ThreadPoolExecutor(max_workers=_EXPORT_WRITE_BATCH) as executor:
+        for line in sys.stdin:
+            source = line.strip()
+            if source:
+                _process_input(extractor, args, source, executor)
+
+
 if __name__ == "__main__":
     main()
@@ -6,9 +6,12 @@ This script provides an overview of all the example scripts and demonstrates
 how to use the GenericCodeExtractor with the EXTRACTOR_USAGE_GUIDE.md file.
 """
 
+import os
 import sys
 from pathlib import Path
 
+HERE = Path(__file__).parent
+
 
 def show_examples_overview():
     """Show overview of all example scripts"""
@@ -127,11 +130,19 @@ def show_examples_overview():
         ("extracted_examples/", "Various export format examples"),
     ]
 
-    utils_dir = Path(__file__).parent
+    utils_dir = HERE
     for dir_name, description in output_dirs:
         dir_path = utils_dir / dir_name
         if dir_path.exists():
-            file_count = len(list(dir_path.glob("*"))) if dir_path.is_dir() else 0
+            if dir_path.is_dir():
+                # Count entries straight off the directory listing; like
+                # glob("*"), skip hidden ones
+                with os.scandir(dir_path) as entries:
+                    file_count = sum(
+                        1 for entry in entries if not entry.name.startswith(".")
+                    )
+            else:
+                file_count = 0
             print(f"   📁 {dir_name:<20} {description} ({file_count} files)")
         else:
             print(f"   📁 {dir_name:<20} {description} (not created yet)")
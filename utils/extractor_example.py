@@ -9,14 +9,39 @@ capabilities.
 
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+HERE = Path(__file__).parent
+GUIDE_PATH = HERE / "EXTRACTOR_USAGE_GUIDE.md"
+
 # Add the utils directory to path so we can import the extractor
-sys.path.append(str(Path(__file__).parent))
+sys.path.append(str(HERE))
 
 from code_extractor import GenericCodeExtractor, setup_logging
 
 
+@lru_cache(maxsize=8)
+def _read_guide(path: str) -> str:
+    """Read a UTF-8 text file once per process; several demos load the guide"""
+    return Path(path).read_text(encoding="utf-8")
+
+
+def _dump_json(data, path: Path) -> None:
+    """Write ``data`` to ``path`` as indented JSON"""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+
+
 def main():
     """Demonstrate code extraction from the usage guide"""
 
@@ -27,7 +52,7 @@ def main():
     extractor = GenericCodeExtractor()
 
     # Path to the usage guide
-    guide_path = Path(__file__).parent / "EXTRACTOR_USAGE_GUIDE.md"
+    guide_path = GUIDE_PATH
 
     print("🔍 Code Extractor Example: Extracting from EXTRACTOR_USAGE_GUIDE.md")
     print("=" * 70)
@@ -37,7 +62,7 @@ def main():
         print(f"❌ Guide file not found: {guide_path}")
         return
 
-    guide_content = guide_path.read_text(encoding="utf-8")
+    guide_content = _read_guide(str(guide_path))
     print(f"📄 Loaded guide content: {len(guide_content)} characters")
 
     # Extract all code blocks
@@ -65,8 +90,9 @@ def main():
     for i, code in enumerate(python_codes[:3], 1):
         print(f"\n   Python Block {i} (confidence: {code.confidence:.3f}):")
         print(f"   Method: {code.extraction_method}")
-        preview = code.content[:100].replace("\n", "\\n")
-        if len(code.content) > 100:
+        content = code.content
+        preview = content[:100].replace("\n", "\\n")
+        if len(content) > 100:
             preview += "..."
         print(f"   Preview: {preview}")
 
@@ -94,48 +120,75 @@ def main():
 
     # Show detailed info for premium Python blocks
     for i, code in enumerate(premium_python, 1):
+        content = code.content
         print(f"\n   Premium Python Block {i}:")
         print(f"     Language: {code.language}")
         print(f"     Confidence: {code.confidence:.3f}")
-        print(f"     Length: {len(code.content)} characters")
+        print(f"     Length: {len(content)} characters")
         print(f"     Method: {code.extraction_method}")
         print(f"     Content preview:")
 
         # Show first few lines of content
-        lines = code.content.split("\n")[:3]
-        for line in lines:
+        lines = content.split("\n")
+        total = len(lines)
+        for line in lines[:3]:
             print(f"       {line}")
-        if len(code.content.split("\n")) > 3:
-            print(f"       ... ({len(code.content.split('\n'))} total lines)")
+        if total > 3:
+            print(f"       ... ({total} total lines)")
 
     # Demonstrate export capabilities
     print(f"\n💾 Export demonstrations:")
 
     # Create output directory
-    output_dir = Path(__file__).parent / "extracted_examples"
+    output_dir = HERE / "extracted_examples"
     output_dir.mkdir(exist_ok=True)
 
-    # Export all codes as individual files
-    print(f"   📁 Exporting all code blocks as individual files...")
-    extractor.export(all_codes, "files", str(output_dir / "all_codes"))
-
-    # Export Python codes as JSON
-    if python_codes:
-        print(f"   📋 Exporting Python codes as JSON...")
-        extractor.export(python_codes, "json", str(output_dir / "python_codes.json"))
-
-    # Export statistics as JSON
-    print(f"   📈 Exporting statistics...")
-    with open(output_dir / "extraction_stats.json", "w") as f:
-        json.dump(stats, f, indent=2)
-
-    # Export high-confidence codes as CSV
-    if high_conf_codes:
-        print(f"   📊 Exporting high-confidence codes as CSV...")
-        extractor.export(
-            high_conf_codes, "csv", str(output_dir / "high_confidence.csv")
+    # The exports are independent and I/O-bound, so let their writes overlap
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = []
+
+        # Export all codes as individual files
+        print(f"   📁 Exporting all code blocks as individual files...")
+        futures.append(
+            pool.submit(
+                extractor.export, all_codes, "files", str(output_dir / "all_codes")
+            )
         )
 
+        # Export Python codes as JSON
+        if python_codes:
+            print(f"   📋 Exporting Python codes as JSON...")
+            futures.append(
+                pool.submit(
+                    extractor.export,
+                    python_codes,
+                    "json",
+                    str(output_dir / "python_codes.json"),
+                )
+            )
+
+        # Export statistics as JSON
+        print(f"   📈 Exporting statistics...")
+        futures.append(
+            pool.submit(_dump_json, stats, output_dir / "extraction_stats.json")
+        )
+
+        # Export high-confidence codes as CSV
+        if high_conf_codes:
+            print(f"   📊 Exporting high-confidence codes as CSV...")
+            futures.append(
+                pool.submit(
+                    extractor.export,
+                    high_conf_codes,
+                    "csv",
+                    str(output_dir / "high_confidence.csv"),
+                )
+            )
+
+        # Surface any export error here rather than losing it in a worker
+        for future in futures:
+            future.result()
+
     print(
         f"\n✅ Example complete! Check the '{output_dir}' directory for exported files."
     )
@@ -223,9 +276,9 @@ def demo_specific_extractions():
 
     # Scenario 3: Extract with specific patterns only
     print("\n🎯 Scenario 3: Using specific patterns only")
-    guide_path = Path(__file__).parent / "EXTRACTOR_USAGE_GUIDE.md"
+    guide_path = GUIDE_PATH
     if guide_path.exists():
-        content = guide_path.read_text()
+        content = _read_guide(str(guide_path))
 
         # Only triple backticks
         triple_only = extractor.extract(content, patterns=["triple_backtick"])
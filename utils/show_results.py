@@ -9,8 +9,11 @@ and displays some of the extracted code blocks.
 import sys
 from pathlib import Path
 
+HERE = Path(__file__).parent
+GUIDE_PATH = HERE / "EXTRACTOR_USAGE_GUIDE.md"
+
 # Add utils to path
-sys.path.append(str(Path(__file__).parent))
+sys.path.append(str(HERE))
 
 from code_extractor import GenericCodeExtractor
 
@@ -19,7 +22,7 @@ def show_extraction_results():
     """Show what the extractor found in the usage guide"""
 
     extractor = GenericCodeExtractor()
-    guide_path = Path(__file__).parent / "EXTRACTOR_USAGE_GUIDE.md"
+    guide_path = GUIDE_PATH
 
     if not guide_path.exists():
         print("❌ EXTRACTOR_USAGE_GUIDE.md not found!")
@@ -43,16 +46,12 @@ def show_extraction_results():
 
     # Show language breakdown
     print(f"\n📈 BY LANGUAGE:")
-    for lang, count in sorted(
-        stats["by_language"].items(), key=lambda x: x[1], reverse=True
-    ):
+    for lang, count in stats["by_language"].items():
         print(f"   {lang:<12}: {count:>2} blocks")
 
     # Show method breakdown
     print(f"\n🔧 BY EXTRACTION METHOD:")
-    for method, count in sorted(
-        stats["by_extraction_method"].items(), key=lambda x: x[1], reverse=True
-    ):
+    for method, count in stats["by_extraction_method"].items():
         print(f"   {method:<18}: {count:>2} blocks")
 
     # Show confidence breakdown
@@ -86,8 +85,9 @@ def show_extraction_results():
     if high_conf:
         print(f"\n⭐ HIGH-CONFIDENCE BLOCKS:")
         for code in high_conf[:3]:
-            preview = code.content[:50].replace("\n", " ")
-            if len(code.content) > 50:
+            content = code.content
+            preview = content[:50].replace("\n", " ")
+            if len(content) > 50:
                 preview += "..."
             print(f"   {code.language:<10} ({code.confidence:.3f}): {preview}")
 
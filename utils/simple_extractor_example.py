@@ -7,10 +7,14 @@ to extract code from the EXTRACTOR_USAGE_GUIDE.md file.
 """
 
 import sys
+from collections import Counter
 from pathlib import Path
 
+HERE = Path(__file__).parent
+GUIDE_PATH = HERE / "EXTRACTOR_USAGE_GUIDE.md"
+
 # Add utils to path
-sys.path.append(str(Path(__file__).parent))
+sys.path.append(str(HERE))
 
 from code_extractor import GenericCodeExtractor
 
@@ -22,7 +26,7 @@ def simple_extraction_example():
     extractor = GenericCodeExtractor()
 
     # Read the usage guide
-    guide_path = Path(__file__).parent / "EXTRACTOR_USAGE_GUIDE.md"
+    guide_path = GUIDE_PATH
 
     if not guide_path.exists():
         print("❌ EXTRACTOR_USAGE_GUIDE.md not found!")
@@ -38,9 +42,7 @@ def simple_extraction_example():
     print(f"✅ Found {len(codes)} code blocks!\n")
 
     # Show summary by language
-    languages = {}
-    for code in codes:
-        languages[code.language] = languages.get(code.language, 0) + 1
+    languages = Counter(code.language for code in codes)
 
     print("📊 Languages found:")
     for lang, count in sorted(languages.items()):
@@ -53,11 +55,12 @@ def simple_extraction_example():
         print(f"\n🐍 Python examples ({len(python_codes)} found):")
         for i, code in enumerate(python_codes[:3], 1):
             print(f"\n   Example {i} (confidence: {code.confidence:.3f}):")
-            lines = code.content.split("\n")[:2]  # First 2 lines
-            for line in lines:
+            lines = code.content.split("\n")
+            total = len(lines)
+            for line in lines[:2]:  # First 2 lines
                 print(f"      {line}")
-            if len(code.content.split("\n")) > 2:
-                print(f"      ... ({len(code.content.split('\n'))} total lines)")
+            if total > 2:
+                print(f"      ... ({total} total lines)")
 
     # Show bash/shell examples
     bash_codes = [c for c in codes if c.language in ["bash", "shell"]]
@@ -68,7 +71,7 @@ def simple_extraction_example():
 
     # Save Python code to files
     if python_codes:
-        output_dir = Path(__file__).parent / "extracted_python"
+        output_dir = HERE / "extracted_python"
         output_dir.mkdir(exist_ok=True)
 
         print(f"\n💾 Saving Python code to {output_dir}/")
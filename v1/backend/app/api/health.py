@@ -1,19 +1,36 @@
 # AI Base Project v1 - Health Check API Router
 # Dedicated router for health check endpoints
 
+import asyncio
+import importlib.metadata
+import importlib.util
+import os
+import sys
+import time
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, NamedTuple, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import JSONResponse, ORJSONResponse
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
-from ..core.database import get_database_session, check_database_connection
+from ..core.database import get_health_session, check_database_connection
 from ..core.config import get_settings
 
-# Create router
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Create router; health payloads are polled often, so serialize them with
+# orjson's C encoder when it is installed
 router = APIRouter(
     prefix="/health",
     tags=["health"],
+    default_response_class=ORJSONResponse if orjson is not None else JSONResponse,
     responses={
         200: {"description": "Health check successful"},
         503: {"description": "Service unavailable"},
@@ -24,175 +41,375 @@ router = APIRouter(
 settings = get_settings()
 
 
-@router.get("/")
-async def basic_health():
+# Probe results are reused for a few seconds so frequent polling from several
+# replicas does not hit the database or /proc for identical answers
+DB_PROBE_TTL = 3.0
+SYSTEM_PROBE_TTL = 1.0
+
+# Upper bound on the database health query, so a hung database cannot hold
+# a probe open until the client gives up
+DB_QUERY_TIMEOUT = 2.0
+
+
+@dataclass
+class _TTLCache:
+    """A cached probe result and the monotonic time it expires at."""
+
+    value: Any
+    expires_at: float
+
+
+_probe_cache: Dict[str, _TTLCache] = {}
+_probe_locks: Dict[str, asyncio.Lock] = {}
+_cpu_primed = False
+
+
+async def _cached(key: str, ttl: float, func, *args, cache_if=None):
     """
-    Basic health check endpoint.
+    Return a result of ``func(*args)`` that is at most ``ttl`` seconds old.
 
-    Returns simple status to verify API is running.
+    On expiry a single caller recomputes while concurrent callers wait on the
+    same lock and reuse its result. Blocking functions run in a worker
+    thread; coroutine functions are awaited. Failures are not cached, nor
+    are results for which ``cache_if`` (if given) returns False, so a
+    recovered service is reported as soon as it is back.
     """
-    return {
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
-        "service": "AI Base API",
-        "version": "1.0.0",
-    }
+    entry = _probe_cache.get(key)
+    if entry is not None and entry.expires_at > time.monotonic():
+        return entry.value
 
+    async with _probe_locks.setdefault(key, asyncio.Lock()):
+        entry = _probe_cache.get(key)
+        if entry is not None and entry.expires_at > time.monotonic():
+            return entry.value
 
-@router.get("/detailed")
-async def detailed_health():
+        if asyncio.iscoroutinefunction(func):
+            value = await func(*args)
+        else:
+            value = await asyncio.to_thread(func, *args)
+        if cache_if is None or cache_if(value):
+            _probe_cache[key] = _TTLCache(value, time.monotonic() + ttl)
+        return value
+
+
+async def _cpu_percent() -> float:
     """
-    Detailed health check endpoint.
+    System-wide CPU usage that does not block on later calls.
 
-    Provides comprehensive system status including:
-    - Database connectivity
-    - System resources
-    - Configuration status
-    - Dependencies status
+    psutil reports usage since its previous call on the same thread, so the
+    first call takes one 100 ms sample in a worker and primes a baseline on
+    the event loop thread; later calls return immediately.
     """
-    try:
-        health_data = {
-            "status": "healthy",
-            "timestamp": datetime.utcnow().isoformat(),
-            "service": "AI Base API",
-            "version": "1.0.0",
-            "checks": {},
-        }
+    global _cpu_primed
+    import psutil
 
-        # Database health check
-        db_healthy = check_database_connection()
-        health_data["checks"]["database"] = {
-            "status": "ok" if db_healthy else "error",
-            "message": (
-                "Database connection successful"
-                if db_healthy
-                else "Database connection failed"
-            ),
-            "type": settings.DATABASE_TYPE,
-            "url_masked": (
-                "***" + settings.DATABASE_URL[-20:]
-                if len(settings.DATABASE_URL) > 20
-                else "***"
-            ),
-        }
+    if _cpu_primed:
+        return psutil.cpu_percent(interval=None)
+    _cpu_primed = True
+    psutil.cpu_percent(interval=None)
+    return await asyncio.to_thread(psutil.cpu_percent, 0.1)
 
-        # Configuration health check
-        config_issues = []
 
-        # Check critical configuration
-        if settings.JWT_SECRET_KEY == "your_jwt_secret_key_here_change_in_production":
-            config_issues.append("JWT secret key not configured")
+@lru_cache()
+def _static_system_info() -> Dict[str, Any]:
+    """Platform details that cannot change while the process is running."""
+    import platform
 
-        if not settings.CORS_ORIGINS:
-            config_issues.append("CORS origins not configured")
+    import psutil
 
-        health_data["checks"]["configuration"] = {
-            "status": "ok" if not config_issues else "warning",
-            "message": (
-                "Configuration OK"
-                if not config_issues
-                else f"Issues: {', '.join(config_issues)}"
-            ),
-            "environment": settings.ENVIRONMENT,
-            "debug": settings.DEBUG,
-        }
+    return {
+        "platform": platform.platform(),
+        "python_version": sys.version,
+        "cpu_count": psutil.cpu_count(),
+    }
 
-        # System checks
-        import os
-        import psutil
 
-        # Memory check
-        memory = psutil.virtual_memory()
-        health_data["checks"]["memory"] = {
-            "status": (
-                "ok"
-                if memory.percent < 80
-                else "warning" if memory.percent < 90 else "critical"
-            ),
-            "usage_percent": memory.percent,
-            "available_gb": round(memory.available / (1024**3), 2),
-            "total_gb": round(memory.total / (1024**3), 2),
-        }
+class _SystemSnapshot(NamedTuple):
+    """Memory, disk and CPU readings taken together for one response."""
 
-        # Disk check
-        disk = psutil.disk_usage("/")
-        health_data["checks"]["disk"] = {
-            "status": (
-                "ok"
-                if disk.percent < 80
-                else "warning" if disk.percent < 90 else "critical"
-            ),
-            "usage_percent": disk.percent,
-            "free_gb": round(disk.free / (1024**3), 2),
-            "total_gb": round(disk.total / (1024**3), 2),
-        }
+    memory: Any
+    disk: Any
+    cpu_percent: float
 
-        # Dependencies check
-        dependencies = {}
 
-        # Check FastAPI
-        try:
-            import fastapi
+# On Linux, memory and disk usage are read straight from /proc/meminfo and
+# statvfs(); elsewhere psutil provides them
+_LINUX = sys.platform.startswith("linux")
 
-            dependencies["fastapi"] = {"status": "ok", "version": fastapi.__version__}
-        except ImportError:
-            dependencies["fastapi"] = {"status": "error", "version": "not installed"}
 
-        # Check Uvicorn
-        try:
-            import uvicorn
+class _MemoryUsage(NamedTuple):
+    """The psutil.virtual_memory() fields the health checks report."""
 
-            dependencies["uvicorn"] = {"status": "ok", "version": uvicorn.__version__}
-        except ImportError:
-            dependencies["uvicorn"] = {"status": "error", "version": "not installed"}
+    total: int
+    available: int
+    used: int
+    percent: float
 
-        # Check SQLAlchemy
-        try:
-            import sqlalchemy
 
-            dependencies["sqlalchemy"] = {
-                "status": "ok",
-                "version": sqlalchemy.__version__,
-            }
-        except ImportError:
-            dependencies["sqlalchemy"] = {"status": "error", "version": "not installed"}
+class _DiskUsage(NamedTuple):
+    """The psutil.disk_usage() fields the health checks report."""
+
+    total: int
+    used: int
+    free: int
+    percent: float
+
+
+def _read_proc_meminfo() -> _MemoryUsage:
+    """Memory usage from /proc/meminfo, computed the way psutil does."""
+    fields = {}
+    with open("/proc/meminfo", "rb") as f:
+        for line in f:
+            name, value = line.split(b":", 1)
+            fields[name] = int(value.split()[0]) * 1024
+
+    total = fields[b"MemTotal"]
+    free = fields[b"MemFree"]
+    buffers = fields.get(b"Buffers", 0)
+    cached = fields.get(b"Cached", 0) + fields.get(b"SReclaimable", 0)
+    available = fields.get(b"MemAvailable", free + buffers + cached)
+    used = total - free - buffers - cached
+    if used < 0:
+        used = total - free
+    percent = round((total - available) / total * 100, 1) if total else 0.0
+    return _MemoryUsage(total, available, used, percent)
+
+
+def _statvfs_disk_usage(path: str) -> _DiskUsage:
+    """Disk usage from a single statvfs() call, computed the way psutil does."""
+    st = os.statvfs(path)
+    total = st.f_blocks * st.f_frsize
+    used = (st.f_blocks - st.f_bfree) * st.f_frsize
+    free = st.f_bavail * st.f_frsize
+    # Like psutil (and df), percent excludes blocks reserved for root
+    percent = round(used / (used + free) * 100, 1) if used + free else 0.0
+    return _DiskUsage(total, used, free, percent)
+
+
+_GIB = float(1 << 30)
+
+
+def _to_gib(n_bytes: int) -> float:
+    """Byte count in GiB, rounded to two decimals for reporting."""
+    return round(n_bytes / _GIB, 2)
+
 
-        # Check Pydantic
+def _read_memory_and_disk():
+    """Read memory and root disk usage in one worker call."""
+    if _LINUX:
+        return _read_proc_meminfo(), _statvfs_disk_usage("/")
+
+    import psutil
+
+    return psutil.virtual_memory(), psutil.disk_usage("/")
+
+
+async def _snapshot_system() -> _SystemSnapshot:
+    """
+    Sample every system resource a health response reports.
+
+    Handlers take one snapshot and share it between their memory, disk and
+    status sections instead of sampling separately for each.
+    """
+    (memory, disk), cpu_percent = await _run_probes(
+        asyncio.to_thread(_read_memory_and_disk), _cpu_percent()
+    )
+    return _SystemSnapshot(memory, disk, cpu_percent)
+
+
+async def _run_probes(*probes):
+    """
+    Await probe coroutines concurrently.
+
+    Every probe is allowed to finish before the first failure is re-raised,
+    so a handler takes as long as its slowest probe rather than the sum of
+    all of them.
+    """
+    results = await asyncio.gather(*probes, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
+
+
+# Dependencies reported by the health checks: (import name, description)
+CRITICAL_DEPENDENCIES = [
+    ("fastapi", "FastAPI web framework"),
+    ("uvicorn", "ASGI server"),
+    ("sqlalchemy", "Database ORM"),
+    ("pydantic", "Data validation"),
+    ("psutil", "System monitoring"),
+]
+OPTIONAL_DEPENDENCIES = [
+    ("redis", "Caching support"),
+    ("pymongo", "MongoDB support"),
+    ("psycopg2", "PostgreSQL support"),
+]
+
+# Distributions to look up when they are not named after the import
+_DISTRIBUTION_NAMES = {"psycopg2": ("psycopg2", "psycopg2-binary")}
+
+
+def _installed_version(dep_name: str) -> Optional[str]:
+    """
+    Version of an importable package, or None if it is not installed.
+
+    find_spec locates the module without executing it; packages importable
+    without distribution metadata (e.g. vendored copies) report "unknown".
+    """
+    if importlib.util.find_spec(dep_name) is None:
+        return None
+    for distribution in _DISTRIBUTION_NAMES.get(dep_name, (dep_name,)):
         try:
-            import pydantic
+            return importlib.metadata.version(distribution)
+        except importlib.metadata.PackageNotFoundError:
+            continue
+    return "unknown"
+
+
+# Installed versions are fixed for the life of the process, so resolve them
+# once from package metadata; nothing is imported just to read a version
+_DEP_VERSIONS: Dict[str, Optional[str]] = {
+    dep_name: _installed_version(dep_name)
+    for dep_name, _ in CRITICAL_DEPENDENCIES + OPTIONAL_DEPENDENCIES
+}
+
+# Framework section of the detailed health check
+_FRAMEWORK_DEPENDENCIES = {
+    dep_name: (
+        {"status": "ok", "version": _DEP_VERSIONS[dep_name]}
+        if _DEP_VERSIONS[dep_name] is not None
+        else {"status": "error", "version": "not installed"}
+    )
+    for dep_name in ("fastapi", "uvicorn", "sqlalchemy", "pydantic")
+}
+
+
+# Check status -> severity, and the overall status each severity maps to
+_SEVERITY = {"ok": 0, "warning": 1, "error": 2, "critical": 3}
+_OVERALL_STATUS = ("healthy", "warning", "degraded", "critical")
+
+# Response parts that never change while the process runs; settings are
+# frozen, so the database and configuration checks are built only once
+_SERVICE_INFO = {"service": "AI Base API", "version": "1.0.0"}
+
+_DB_CHECK_OK = {
+    "status": "ok",
+    "message": "Database connection successful",
+    "type": settings.DATABASE_TYPE,
+    "url_masked": settings.masked_db_url,
+}
+_DB_CHECK_ERROR = {
+    **_DB_CHECK_OK,
+    "status": "error",
+    "message": "Database connection failed",
+}
+
+
+def _configuration_check() -> Dict[str, Any]:
+    """Configuration section of the detailed health check."""
+    config_issues = []
+
+    # Check critical configuration
+    if settings.jwt_is_default:
+        config_issues.append("JWT secret key not configured")
+
+    if not settings.CORS_ORIGINS:
+        config_issues.append("CORS origins not configured")
 
-            dependencies["pydantic"] = {"status": "ok", "version": pydantic.__version__}
-        except ImportError:
-            dependencies["pydantic"] = {"status": "error", "version": "not installed"}
+    return {
+        "status": "ok" if not config_issues else "warning",
+        "message": (
+            "Configuration OK"
+            if not config_issues
+            else f"Issues: {', '.join(config_issues)}"
+        ),
+        "environment": settings.ENVIRONMENT,
+        "debug": settings.DEBUG,
+    }
 
-        health_data["checks"]["dependencies"] = dependencies
 
-        # Determine overall status
-        overall_status = "healthy"
+_CONFIGURATION_CHECK = _configuration_check()
 
-        # Check for critical issues
+
+@router.get("/")
+async def basic_health():
+    """
+    Basic health check endpoint.
+
+    Returns simple status to verify API is running.
+    """
+    return {
+        "status": "healthy",
+        "timestamp": datetime.utcnow().isoformat(),
+        **_SERVICE_INFO,
+    }
+
+
+@router.get("/detailed")
+async def detailed_health():
+    """
+    Detailed health check endpoint.
+
+    Provides comprehensive system status including:
+    - Database connectivity
+    - System resources
+    - Configuration status
+    - Dependencies status
+    """
+    timestamp = datetime.utcnow().isoformat()
+    try:
+        # The database and system probes both block, so run them side by
+        # side instead of one after another
+        db_healthy, system = await _run_probes(
+            _cached("database", DB_PROBE_TTL, check_database_connection, cache_if=bool),
+            _cached("system", SYSTEM_PROBE_TTL, _snapshot_system),
+        )
+        memory, disk = system.memory, system.disk
+
+        checks = {
+            "database": _DB_CHECK_OK if db_healthy else _DB_CHECK_ERROR,
+            "configuration": _CONFIGURATION_CHECK,
+            "memory": {
+                "status": (
+                    "ok"
+                    if memory.percent < 80
+                    else "warning" if memory.percent < 90 else "critical"
+                ),
+                "usage_percent": memory.percent,
+                "available_gb": _to_gib(memory.available),
+                "total_gb": _to_gib(memory.total),
+            },
+            "disk": {
+                "status": (
+                    "ok"
+                    if disk.percent < 80
+                    else "warning" if disk.percent < 90 else "critical"
+                ),
+                "usage_percent": disk.percent,
+                "free_gb": _to_gib(disk.free),
+                "total_gb": _to_gib(disk.total),
+            },
+            "dependencies": _FRAMEWORK_DEPENDENCIES,
+        }
+
+        # Determine overall status from the most severe check
         if not db_healthy:
             overall_status = "unhealthy"
-        elif any(
-            check.get("status") == "critical"
-            for check in health_data["checks"].values()
-            if isinstance(check, dict)
-        ):
-            overall_status = "critical"
-        elif any(
-            check.get("status") == "error"
-            for check in health_data["checks"].values()
-            if isinstance(check, dict)
-        ):
-            overall_status = "degraded"
-        elif any(
-            check.get("status") == "warning"
-            for check in health_data["checks"].values()
-            if isinstance(check, dict)
-        ):
-            overall_status = "warning"
-
-        health_data["status"] = overall_status
+        else:
+            severity = 0
+            for check in checks.values():
+                level = _SEVERITY.get(check.get("status"), 0)
+                if level > severity:
+                    severity = level
+            overall_status = _OVERALL_STATUS[severity]
+
+        health_data = {
+            "status": overall_status,
+            "timestamp": timestamp,
+            **_SERVICE_INFO,
+            "checks": checks,
+        }
 
         # Return appropriate HTTP status
         if overall_status in ["unhealthy", "critical"]:
@@ -210,47 +427,59 @@ async def detailed_health():
             detail={
                 "status": "error",
                 "message": f"Health check failed: {str(e)}",
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": timestamp,
             },
         )
 
 
+def _test_query(db: Session):
+    """Run the trivial query used to prove the database answers."""
+    return db.execute(text("SELECT 1 as test")).fetchone()
+
+
 @router.get("/database")
-async def database_health(db: Session = Depends(get_database_session)):
+async def database_health(db: Session = Depends(get_health_session)):
     """
     Database-specific health check.
 
     Tests database connectivity and basic operations.
     """
+    timestamp = datetime.utcnow().isoformat()
     try:
         # Test basic query
-        from sqlalchemy import text
-
-        result = db.execute(text("SELECT 1 as test")).fetchone()
+        result = await asyncio.wait_for(
+            asyncio.to_thread(_test_query, db), timeout=DB_QUERY_TIMEOUT
+        )
 
-        # Get database info
+        # Get database info; only local metadata, so the probe never waits
+        # on the application pool. The test query above already proved the
+        # connection.
         from ..core.database import get_database_info
 
         db_info = get_database_info()
 
         return {
             "status": "healthy",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": timestamp,
             "database": {
                 "connection": "ok",
                 "test_query": bool(result),
                 "type": db_info["type"],
-                "connection_status": db_info["connection_status"],
+                "connection_status": bool(result),
             },
         }
 
     except Exception as e:
+        if isinstance(e, asyncio.TimeoutError):
+            error = f"Test query timed out after {DB_QUERY_TIMEOUT}s"
+        else:
+            error = str(e)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail={
                 "status": "unhealthy",
-                "timestamp": datetime.utcnow().isoformat(),
-                "database": {"connection": "error", "error": str(e)},
+                "timestamp": timestamp,
+                "database": {"connection": "error", "error": error},
             },
         )
 
@@ -262,25 +491,20 @@ async def system_health():
 
     Returns system resource usage and availability.
     """
+    timestamp = datetime.utcnow().isoformat()
     try:
-        import psutil
-        import platform
-        import sys
+        memory, disk, cpu_percent = await _cached(
+            "system", SYSTEM_PROBE_TTL, _snapshot_system
+        )
 
         # System information
-        system_info = {
-            "platform": platform.platform(),
-            "python_version": sys.version,
-            "cpu_count": psutil.cpu_count(),
-            "cpu_percent": psutil.cpu_percent(interval=0.1),
-        }
+        system_info = {**_static_system_info(), "cpu_percent": cpu_percent}
 
         # Memory information
-        memory = psutil.virtual_memory()
         memory_info = {
-            "total_gb": round(memory.total / (1024**3), 2),
-            "available_gb": round(memory.available / (1024**3), 2),
-            "used_gb": round(memory.used / (1024**3), 2),
+            "total_gb": _to_gib(memory.total),
+            "available_gb": _to_gib(memory.available),
+            "used_gb": _to_gib(memory.used),
             "percent": memory.percent,
             "status": (
                 "ok"
@@ -290,11 +514,10 @@ async def system_health():
         }
 
         # Disk information
-        disk = psutil.disk_usage("/")
         disk_info = {
-            "total_gb": round(disk.total / (1024**3), 2),
-            "free_gb": round(disk.free / (1024**3), 2),
-            "used_gb": round(disk.used / (1024**3), 2),
+            "total_gb": _to_gib(disk.total),
+            "free_gb": _to_gib(disk.free),
+            "used_gb": _to_gib(disk.used),
             "percent": disk.percent,
             "status": (
                 "ok"
@@ -312,7 +535,7 @@ async def system_health():
 
         return {
             "status": system_status,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": timestamp,
             "system": system_info,
             "memory": memory_info,
             "disk": disk_info,
@@ -324,7 +547,7 @@ async def system_health():
             detail={
                 "status": "error",
                 "message": f"System health check failed: {str(e)}",
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": timestamp,
             },
         )
 
@@ -336,28 +559,20 @@ async def dependencies_health():
 
     Verifies all required dependencies are installed and accessible.
     """
+    timestamp = datetime.utcnow().isoformat()
     try:
         dependencies = {}
 
         # Critical dependencies
-        critical_deps = [
-            ("fastapi", "FastAPI web framework"),
-            ("uvicorn", "ASGI server"),
-            ("sqlalchemy", "Database ORM"),
-            ("pydantic", "Data validation"),
-            ("psutil", "System monitoring"),
-        ]
-
-        for dep_name, description in critical_deps:
-            try:
-                module = __import__(dep_name)
-                version = getattr(module, "__version__", "unknown")
+        for dep_name, description in CRITICAL_DEPENDENCIES:
+            version = _DEP_VERSIONS[dep_name]
+            if version is not None:
                 dependencies[dep_name] = {
                     "status": "ok",
                     "version": version,
                     "description": description,
                 }
-            except ImportError:
+            else:
                 dependencies[dep_name] = {
                     "status": "error",
                     "version": "not installed",
@@ -365,23 +580,16 @@ async def dependencies_health():
                 }
 
         # Optional dependencies
-        optional_deps = [
-            ("redis", "Caching support"),
-            ("pymongo", "MongoDB support"),
-            ("psycopg2", "PostgreSQL support"),
-        ]
-
-        for dep_name, description in optional_deps:
-            try:
-                module = __import__(dep_name)
-                version = getattr(module, "__version__", "unknown")
+        for dep_name, description in OPTIONAL_DEPENDENCIES:
+            version = _DEP_VERSIONS[dep_name]
+            if version is not None:
                 dependencies[dep_name] = {
                     "status": "ok",
                     "version": version,
                     "description": description,
                     "optional": True,
                 }
-            except ImportError:
+            else:
                 dependencies[dep_name] = {
                     "status": "missing",
                     "version": "not installed",
@@ -403,7 +611,7 @@ async def dependencies_health():
 
         return {
             "status": deps_status,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": timestamp,
             "dependencies": dependencies,
             "summary": {
                 "total": len(dependencies),
@@ -425,6 +633,6 @@ async def dependencies_health():
             detail={
                 "status": "error",
                 "message": f"Dependencies health check failed: {str(e)}",
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": timestamp,
             },
         )
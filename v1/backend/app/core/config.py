@@ -2,8 +2,8 @@
 # Centralized configuration management using Pydantic settings
 
 import os
-from typing import List, Optional, Any, Union
-from functools import lru_cache
+from typing import List, Optional, Any, Tuple, Union
+from functools import cached_property, lru_cache
 
 try:
     from pydantic_settings import BaseSettings
@@ -26,6 +26,14 @@ except ImportError:
         ConfigDict = None
 
 
+# Parsed form of the default CORS_ORIGINS; a tuple so the default is shared
+# safely between instances and needs no parsing
+DEFAULT_CORS_ORIGINS = ("http://localhost:3000", "http://127.0.0.1:3000")
+
+# Placeholder secret shipped as the default; must be replaced in production
+DEFAULT_JWT_SECRET_KEY = "your_jwt_secret_key_here_change_in_production"
+
+
 class Settings(BaseSettings):
     """
     Application settings using Pydantic BaseSettings.
@@ -68,6 +76,21 @@ class Settings(BaseSettings):
     POSTGRES_USER: str = Field(default="ai_user", description="PostgreSQL username")
     POSTGRES_PASSWORD: str = Field(default="", description="PostgreSQL password")
 
+    # Connection pool configuration (PostgreSQL and file-based SQLite)
+    DB_POOL_SIZE: int = Field(default=10, description="Persistent pool connections")
+    DB_MAX_OVERFLOW: int = Field(
+        default=20, description="Extra connections allowed beyond the pool size"
+    )
+    DB_POOL_TIMEOUT: int = Field(
+        default=30, description="Seconds to wait for a free pooled connection"
+    )
+    DB_POOL_RECYCLE: int = Field(
+        default=1800, description="Seconds before a pooled connection is replaced"
+    )
+    DB_POOL_PRE_PING: bool = Field(
+        default=True, description="Validate connections on checkout"
+    )
+
     # MongoDB Configuration (for NoSQL features)
     MONGODB_HOST: str = Field(default="localhost", description="MongoDB host")
     MONGODB_PORT: int = Field(default=27017, description="MongoDB port")
@@ -76,8 +99,8 @@ class Settings(BaseSettings):
     MONGODB_PASSWORD: str = Field(default="", description="MongoDB password")
 
     # CORS Configuration
-    CORS_ORIGINS: Union[str, List[str]] = Field(
-        default="http://localhost:3000,http://127.0.0.1:3000",
+    CORS_ORIGINS: Union[str, Tuple[str, ...]] = Field(
+        default=DEFAULT_CORS_ORIGINS,
         description="Allowed CORS origins (comma-separated string or list)",
     )
     CORS_ALLOW_CREDENTIALS: bool = Field(
@@ -92,7 +115,7 @@ class Settings(BaseSettings):
 
     # Security Configuration
     JWT_SECRET_KEY: str = Field(
-        default="your_jwt_secret_key_here_change_in_production",
+        default=DEFAULT_JWT_SECRET_KEY,
         description="JWT secret key",
     )
     JWT_ALGORITHM: str = Field(default="HS256", description="JWT algorithm")
@@ -130,20 +153,22 @@ class Settings(BaseSettings):
     # Development Configuration
     HOT_RELOAD: bool = Field(default=True, description="Enable hot reload")
     AUTO_RELOAD: bool = Field(default=True, description="Enable auto reload")
-    DEV_TOOLS: bool = Field(
-        default=True, description="Enable development tools"
-    )  # Version Configuration
+    DEV_TOOLS: bool = Field(default=True, description="Enable development tools")
+
+    # Version Configuration
     PROJECT_VERSION: str = Field(default="v1", description="Project version")
     PYTHON_VERSION: str = Field(default="3.12", description="Python version")
     NODE_ENV: str = Field(default="development", description="Node environment")
 
     # Pydantic v2 configuration
+    # Frozen so the derived cached properties below can never go stale
     if PYDANTIC_V2:
         model_config = ConfigDict(
             env_file=".env",
             env_file_encoding="utf-8",
             case_sensitive=True,
             extra="ignore",
+            frozen=True,
         )
     else:
 
@@ -151,6 +176,8 @@ class Settings(BaseSettings):
             env_file = ".env"
             env_file_encoding = "utf-8"
             case_sensitive = True
+            allow_mutation = False
+            keep_untouched = (cached_property,)
             # Look for .env files in multiple locations
             env_file_paths = [
                 ".env",
@@ -163,13 +190,16 @@ class Settings(BaseSettings):
     @classmethod
     def parse_cors_origins(cls, v):
         """Parse CORS origins from string or list."""
+        if isinstance(v, tuple):
+            # Already parsed, e.g. the default
+            return v
         if isinstance(v, str):
             if not v or v.strip() == "":
-                return ["http://localhost:3000", "http://127.0.0.1:3000"]
-            return [origin.strip() for origin in v.split(",") if origin.strip()]
+                return DEFAULT_CORS_ORIGINS
+            return tuple(origin.strip() for origin in v.split(",") if origin.strip())
         elif isinstance(v, list):
-            return v
-        return ["http://localhost:3000", "http://127.0.0.1:3000"]
+            return tuple(v)
+        return DEFAULT_CORS_ORIGINS
 
     @field_validator("CORS_ALLOW_METHODS", mode="before")
     @classmethod
@@ -206,14 +236,16 @@ class Settings(BaseSettings):
             os.makedirs(os.path.dirname(db_path), exist_ok=True)
         return v
 
+    @field_validator("LOG_LEVEL")
     @classmethod
     def validate_log_level(cls, v):
         """Validate log level."""
         valid_levels = ["debug", "info", "warning", "error", "critical"]
         if v.lower() not in valid_levels:
             raise ValueError(f"Log level must be one of: {valid_levels}")
-        return v.lower() @ field_validator("ENVIRONMENT")
+        return v.lower()
 
+    @field_validator("ENVIRONMENT")
     @classmethod
     def validate_environment(cls, v):
         """Validate environment."""
@@ -228,18 +260,33 @@ class Settings(BaseSettings):
             return self.TEST_DATABASE_URL
         return self.DATABASE_URL
 
+    @cached_property
     def is_development(self) -> bool:
-        """Check if running in development mode."""
+        """Whether running in development mode."""
         return self.ENVIRONMENT == "development"
 
+    @cached_property
     def is_production(self) -> bool:
-        """Check if running in production mode."""
+        """Whether running in production mode."""
         return self.ENVIRONMENT == "production"
 
+    @cached_property
     def is_testing(self) -> bool:
-        """Check if running in testing mode."""
+        """Whether running in testing mode."""
         return self.TESTING or self.ENVIRONMENT == "testing"
 
+    @cached_property
+    def jwt_is_default(self) -> bool:
+        """Whether JWT_SECRET_KEY is still the shipped placeholder."""
+        return self.JWT_SECRET_KEY == DEFAULT_JWT_SECRET_KEY
+
+    @cached_property
+    def masked_db_url(self) -> str:
+        """DATABASE_URL with everything but its tail masked, safe to report."""
+        if len(self.DATABASE_URL) > 20:
+            return "***" + self.DATABASE_URL[-20:]
+        return "***"
+
 
 @lru_cache()
 def get_settings() -> Settings:
@@ -261,8 +308,8 @@ def validate_configuration():
     warnings = []
 
     # Security checks
-    if settings.is_production():
-        if settings.JWT_SECRET_KEY == "your_jwt_secret_key_here_change_in_production":
+    if settings.is_production:
+        if settings.jwt_is_default:
             errors.append("JWT_SECRET_KEY must be changed in production")
 
         if settings.SESSION_SECRET_KEY == "your_session_secret_here":
@@ -286,7 +333,7 @@ def validate_configuration():
                 errors.append(f"Cannot create database directory {db_dir}: {e}")
 
     # CORS checks
-    if settings.is_production() and "*" in settings.CORS_ORIGINS:
+    if settings.is_production and "*" in settings.CORS_ORIGINS:
         warnings.append("Wildcard CORS origins should not be used in production")
 
     return {"errors": errors, "warnings": warnings}
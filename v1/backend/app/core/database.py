@@ -1,22 +1,47 @@
 # AI Base Project v1 - Database Configuration
 # SQLAlchemy database setup with support for SQLite, PostgreSQL, and MongoDB
 
+import logging
 import os
+import threading
+import time
+from functools import lru_cache, wraps
 from typing import Generator
 
-from sqlalchemy import create_engine, MetaData
+from sqlalchemy import create_engine, event, func, select, text, MetaData
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
+from sqlalchemy.sql import table
 
 from .config import get_settings
 
+logger = logging.getLogger(__name__)
+
 # Get settings
 settings = get_settings()
 
 # Database URL
 DATABASE_URL = settings.get_database_url()
 
+
+def _sqlite_pool_options(url: str) -> dict:
+    """
+    Pool arguments for a SQLite engine.
+
+    File databases get a real pool so threads can read in parallel (WAL is
+    enabled below); an in-memory database only exists inside its single
+    connection, so it keeps StaticPool.
+    """
+    if url in ("sqlite://", "sqlite:///:memory:") or "mode=memory" in url:
+        return {"poolclass": StaticPool}
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+
+
 # SQLAlchemy engine configuration
 if settings.DATABASE_TYPE == "sqlite":
     # SQLite configuration
@@ -26,17 +51,18 @@ if settings.DATABASE_TYPE == "sqlite":
         connect_args={
             "check_same_thread": False,  # Allow SQLite to be used with multiple threads
         },
-        poolclass=StaticPool,  # Use static pool for SQLite
+        **_sqlite_pool_options(DATABASE_URL),
     )
 elif settings.DATABASE_TYPE == "postgresql":
     # PostgreSQL configuration
     engine = create_engine(
         DATABASE_URL,
         echo=settings.SQLITE_ECHO,
-        pool_size=20,  # Connection pool size
-        max_overflow=0,  # Maximum overflow connections
-        pool_pre_ping=True,  # Validate connections before use
-        pool_recycle=300,  # Recycle connections every 5 minutes
+        pool_size=settings.DB_POOL_SIZE,  # Connection pool size
+        max_overflow=settings.DB_MAX_OVERFLOW,  # Burst connections beyond the pool
+        pool_timeout=settings.DB_POOL_TIMEOUT,  # Wait for a free connection
+        pool_recycle=settings.DB_POOL_RECYCLE,  # Replace long-lived connections
+        pool_pre_ping=settings.DB_POOL_PRE_PING,  # Validate connections before use
     )
 else:
     # Default to SQLite
@@ -44,12 +70,109 @@ else:
         DATABASE_URL,
         echo=settings.SQLITE_ECHO,
         connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
+        **_sqlite_pool_options(DATABASE_URL),
     )
 
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Dedicated engine for health checks, so probes never queue behind
+# application traffic in the main pool
+if settings.DATABASE_TYPE == "postgresql":
+    health_engine = create_engine(
+        DATABASE_URL,
+        pool_size=1,  # Health checks only ever need one connection
+        max_overflow=1,
+        pool_timeout=2,  # Fail fast instead of waiting 30s for a connection
+        pool_pre_ping=True,
+        pool_recycle=300,
+    )
+elif "poolclass" in _sqlite_pool_options(DATABASE_URL):
+    # An in-memory database only exists inside the main engine's single
+    # connection; a second engine would probe a different, empty database
+    health_engine = engine
+else:
+    health_engine = create_engine(
+        DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        pool_size=1,  # Health checks only ever need one connection
+        max_overflow=1,
+        pool_timeout=2,  # Fail fast instead of waiting 30s for a connection
+    )
+
+HealthSession = sessionmaker(autocommit=False, autoflush=False, bind=health_engine)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Tune each new SQLite connection.
+
+    WAL lets readers run alongside a writer, and synchronous=NORMAL only
+    fsyncs at checkpoints, which is safe in WAL mode.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+    cursor.execute("PRAGMA cache_size=-64000")  # ~64 MB
+    cursor.close()
+
+
+for _engine in {engine, health_engine}:
+    if _engine.dialect.name == "sqlite":
+        event.listen(_engine, "connect", _set_sqlite_pragmas)
+
+# Statements used on every call are built once; text() objects are
+# immutable and reuse SQLAlchemy's compiled statement cache
+_PING_QUERY = text("SELECT 1")
+_SQLITE_TABLES_QUERY = text("SELECT name FROM sqlite_master WHERE type='table'")
+_POSTGRES_TABLES_QUERY = text(
+    "SELECT tablename FROM pg_tables WHERE schemaname='public'"
+)
+
+
+@lru_cache(maxsize=128)
+def _count_query(table_name: str):
+    """SELECT count(*) statement for a table; compiled once per table name."""
+    return select(func.count()).select_from(table(table_name))
+
+
+# Database metadata and table names are reused for a few seconds so bursts
+# of health polls do not each stat the file or open a session. Connection
+# status is not cached here; the health endpoints cache it themselves.
+DATABASE_INFO_TTL = 5.0
+
+
+def _ttl_cache(ttl: float):
+    """Cache a no-argument function's result for ``ttl`` seconds."""
+
+    def decorator(func):
+        lock = threading.Lock()
+        value = None
+        expires_at = 0.0
+
+        @wraps(func)
+        def wrapper():
+            nonlocal value, expires_at
+            if time.monotonic() < expires_at:
+                return value
+            with lock:
+                if time.monotonic() >= expires_at:
+                    value = func()
+                    expires_at = time.monotonic() + ttl
+                return value
+
+        def cache_clear():
+            nonlocal expires_at
+            expires_at = 0.0
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
+
+
 # Base class for declarative models
 Base = declarative_base()
 
@@ -76,24 +199,40 @@ def get_database_session() -> Generator[Session, None, None]:
         db.close()
 
 
+def get_health_session() -> Generator[Session, None, None]:
+    """
+    Dependency to get a session from the health check pool.
+
+    Yields:
+        Session: SQLAlchemy session bound to ``health_engine``
+    """
+    db = HealthSession()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
 def create_tables():
     """Create all database tables."""
     Base.metadata.create_all(bind=engine)
-    print("✅ Database tables created successfully")
+    _table_names.cache_clear()
+    logger.info("Database tables created successfully")
 
 
 def drop_tables():
     """Drop all database tables."""
     Base.metadata.drop_all(bind=engine)
-    print("✅ Database tables dropped successfully")
+    _table_names.cache_clear()
+    logger.info("Database tables dropped successfully")
 
 
 def reset_database():
     """Reset database by dropping and recreating all tables."""
-    print("🔄 Resetting database...")
+    logger.info("Resetting database...")
     drop_tables()
     create_tables()
-    print("✅ Database reset completed")
+    logger.info("Database reset completed")
 
 
 def check_database_connection() -> bool:
@@ -106,28 +245,38 @@ def check_database_connection() -> bool:
     try:
         db = SessionLocal()
         # Test connection with a simple query
-        from sqlalchemy import text
-
-        db.execute(text("SELECT 1"))
+        db.execute(_PING_QUERY)
         db.close()
         return True
     except Exception as e:
-        print(f"❌ Database connection failed: {e}")
+        logger.error("Database connection failed: %s", e)
         return False
 
 
-def get_database_info() -> dict:
+def get_database_info(probe: bool = False) -> dict:
     """
     Get database information and statistics.
 
+    Args:
+        probe (bool): Also report ``connection_status`` by querying the
+            database; otherwise only local metadata is read
+
     Returns:
         dict: Database information including type, URL, and statistics
     """
+    info = dict(_database_metadata())
+    if probe:
+        info["connection_status"] = check_database_connection()
+    return info
+
+
+@_ttl_cache(DATABASE_INFO_TTL)
+def _database_metadata() -> dict:
+    """Database details that need no query, such as the SQLite file size."""
     info = {
         "type": settings.DATABASE_TYPE,
         "url": DATABASE_URL,
         "echo": settings.SQLITE_ECHO,
-        "connection_status": check_database_connection(),
     }
 
     # Add SQLite-specific information
@@ -162,6 +311,24 @@ def get_database_info() -> dict:
     return info
 
 
+@_ttl_cache(DATABASE_INFO_TTL)
+def _table_names() -> list:
+    """List the tables in the database."""
+    try:
+        with SessionLocal() as db:
+            if settings.DATABASE_TYPE == "sqlite":
+                result = db.execute(_SQLITE_TABLES_QUERY)
+            elif settings.DATABASE_TYPE == "postgresql":
+                result = db.execute(_POSTGRES_TABLES_QUERY)
+            else:
+                return []
+
+            return [row[0] for row in result.fetchall()]
+    except Exception as e:
+        logger.error("Error getting table names: %s", e)
+        return []
+
+
 class DatabaseManager:
     """Database manager for handling database operations."""
 
@@ -189,9 +356,9 @@ class DatabaseManager:
         """Check database connection."""
         return check_database_connection()
 
-    def get_info(self) -> dict:
+    def get_info(self, probe: bool = False) -> dict:
         """Get database information."""
-        return get_database_info()
+        return get_database_info(probe)
 
     def execute_raw_query(self, query: str) -> list:
         """
@@ -204,28 +371,12 @@ class DatabaseManager:
             list: Query results
         """
         with self.get_session() as db:
-            result = db.execute(query)
+            result = db.execute(text(query))
             return result.fetchall()
 
     def get_table_names(self) -> list:
         """Get list of all table names in the database."""
-        try:
-            with self.get_session() as db:
-                if settings.DATABASE_TYPE == "sqlite":
-                    result = db.execute(
-                        "SELECT name FROM sqlite_master WHERE type='table'"
-                    )
-                elif settings.DATABASE_TYPE == "postgresql":
-                    result = db.execute(
-                        "SELECT tablename FROM pg_tables WHERE schemaname='public'"
-                    )
-                else:
-                    return []
-
-                return [row[0] for row in result.fetchall()]
-        except Exception as e:
-            print(f"❌ Error getting table names: {e}")
-            return []
+        return _table_names()
 
     def get_table_count(self, table_name: str) -> int:
         """
@@ -236,13 +387,22 @@ class DatabaseManager:
 
         Returns:
             int: Number of rows in the table
+
+        Raises:
+            ValueError: If the table does not exist in the database
         """
+        if table_name not in _table_names():
+            # The name list is cached; refresh once in case the table is new
+            _table_names.cache_clear()
+            if table_name not in _table_names():
+                raise ValueError(f"Unknown table: {table_name}")
+
         try:
             with self.get_session() as db:
-                result = db.execute(f"SELECT COUNT(*) FROM {table_name}")
+                result = db.execute(_count_query(table_name))
                 return result.fetchone()[0]
         except Exception as e:
-            print(f"❌ Error getting table count for {table_name}: {e}")
+            logger.error("Error getting table count for %s: %s", table_name, e)
             return 0
 
 
@@ -260,7 +420,7 @@ def init_database():
             db_dir = os.path.dirname(db_path)
             if db_dir and not os.path.exists(db_dir):
                 os.makedirs(db_dir, exist_ok=True)
-                print(f"✅ Created database directory: {db_dir}")
+                logger.info("Created database directory: %s", db_dir)
 
         # Check connection
         if not check_database_connection():
@@ -269,18 +429,18 @@ def init_database():
         # Create tables
         create_tables()
 
-        print("✅ Database initialized successfully")
+        logger.info("Database initialized successfully")
 
         # Print database info
-        info = get_database_info()
-        print(f"📊 Database type: {info['type']}")
+        info = get_database_info(probe=True)
+        logger.info("Database type: %s", info["type"])
         if info["type"] == "sqlite":
-            print(f"📁 Database file: {info['file_path']}")
+            logger.info("Database file: %s", info["file_path"])
             if info["file_exists"]:
-                print(f"📊 File size: {info.get('file_size_mb', 0)} MB")
+                logger.info("File size: %s MB", info.get("file_size_mb", 0))
 
-    except Exception as e:
-        print(f"❌ Database initialization failed: {e}")
+    except Exception:
+        logger.exception("Database initialization failed")
         raise
 
 
@@ -290,6 +450,9 @@ __all__ = [
     "SessionLocal",
     "Base",
     "get_database_session",
+    "health_engine",
+    "HealthSession",
+    "get_health_session",
     "create_tables",
     "drop_tables",
     "reset_database",
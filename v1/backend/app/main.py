@@ -2,29 +2,28 @@
 # Health Check & System Verification API
 
 import asyncio
+import importlib.util
 import os
 import platform
 import shutil
 import sys
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
-import sqlite3
 import subprocess
 
-# Import with graceful fallback
-try:
-    import psutil
-
-    PSUTIL_AVAILABLE = True
-except ImportError:
-    PSUTIL_AVAILABLE = False
+# psutil is only needed by the detailed health check, so it is imported
+# where it is used; only check here that it is installed
+PSUTIL_AVAILABLE = importlib.util.find_spec("psutil") is not None
+if not PSUTIL_AVAILABLE:
     print("⚠️ psutil not available - system monitoring will be limited")
 
 try:
     from fastapi import FastAPI, HTTPException, status
     from fastapi.middleware.cors import CORSMiddleware
-    from fastapi.responses import JSONResponse
+    from fastapi.responses import JSONResponse, ORJSONResponse
     from pydantic import BaseModel, Field
 
     FASTAPI_AVAILABLE = True
@@ -43,13 +42,20 @@ if not FASTAPI_AVAILABLE:
     print("   pip install -r requirements.txt")
     sys.exit(1)
 
-# Initialize FastAPI app
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Initialize FastAPI app; responses are serialized with orjson's C encoder
+# when it is installed
 app = FastAPI(
     title="AI Base API",
     description="FastAPI backend for AI Base Project with comprehensive health checks",
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse if orjson is not None else JSONResponse,
 )
 
 # Get settings
@@ -65,21 +71,43 @@ app.add_middleware(
 )
 
 # Include routers
+# Health stays on the main app rather than a middleware-free sub-app: the
+# dashboard calls it cross-origin, and CORSMiddleware already passes
+# probe requests without an Origin header straight through
 app.include_router(health_router, prefix="/api/v1")
 
 
+# Static part of the root endpoint's response
+_ROOT_INFO = {
+    "message": "AI Base Project API",
+    "version": "1.0.0",
+    "docs": "/docs",
+    "health": "/api/v1/health",
+    "detailed_health": "/api/v1/health/detailed",
+}
+
+
 # Root endpoint
 @app.get("/")
 async def root():
     """Root endpoint providing API information."""
-    return {
-        "message": "AI Base Project API",
-        "version": "1.0.0",
-        "docs": "/docs",
-        "health": "/api/v1/health",
-        "detailed_health": "/api/v1/health/detailed",
-        "timestamp": datetime.utcnow().isoformat(),
-    }
+    return {**_ROOT_INFO, "timestamp": datetime.utcnow().isoformat()}
+
+
+def _init_database_schema():
+    """Create missing tables and verify the connection (blocking)."""
+    from sqlalchemy import text
+
+    from .models import Base
+
+    Base.metadata.create_all(bind=engine)
+    print("✅ Database tables created/verified")  # Verify database connection
+    db = SessionLocal()
+    try:
+        db.execute(text("SELECT 1"))
+        print("✅ Database connection verified")
+    finally:
+        db.close()
 
 
 # Startup event
@@ -87,19 +115,8 @@ async def root():
 async def startup_event():
     """Initialize database and perform startup checks."""
     try:
-        # Create database tables if they don't exist
-        from .models import Base
-
-        Base.metadata.create_all(bind=engine)
-        print("✅ Database tables created/verified")  # Verify database connection
-        db = SessionLocal()
-        try:
-            from sqlalchemy import text
-
-            db.execute(text("SELECT 1"))
-            print("✅ Database connection verified")
-        finally:
-            db.close()
+        # Create database tables if they don't exist, off the event loop
+        await asyncio.to_thread(_init_database_schema)
 
     except Exception as e:
         print(f"❌ Startup error: {e}")
@@ -138,8 +155,15 @@ class DetailedHealthResponse(BaseModel):
     checks: Dict[str, Any] = Field(..., description="Health check results")
 
 
-# Store startup time for uptime calculation
-startup_time = datetime.utcnow()
+# Store startup time for uptime calculation; the monotonic clock is not
+# affected by wall-clock adjustments
+_STARTUP_MONOTONIC_NS = time.monotonic_ns()
+
+
+def _uptime() -> str:
+    """Time since startup, formatted like a timedelta (H:MM:SS.ffffff)."""
+    elapsed_us = (time.monotonic_ns() - _STARTUP_MONOTONIC_NS) // 1000
+    return str(timedelta(microseconds=elapsed_us))
 
 
 # Basic health check endpoint
@@ -150,12 +174,10 @@ async def health_check():
 
     Returns simple status information to verify the API is running.
     """
-    uptime = datetime.utcnow() - startup_time
-
     return HealthResponse(
         status="healthy",
         timestamp=datetime.utcnow().isoformat(),
-        uptime=str(uptime),
+        uptime=_uptime(),
         version="1.0.0",
     )
 
@@ -175,46 +197,48 @@ async def detailed_health_check():
     - Performance metrics
     """
     try:
-        uptime = datetime.utcnow() - startup_time
+        import psutil
+
+        uptime = _uptime()
+
+        # Sample memory and disk once and share the readings below
+        memory = psutil.virtual_memory()
+        disk = psutil.disk_usage("/")
 
         # System information
         system_info = {
-            "platform": platform.platform(),
-            "architecture": platform.architecture()[0],
-            "processor": platform.processor(),
-            "python_version": sys.version,
-            "python_executable": sys.executable,
-            "cpu_count": psutil.cpu_count(),
-            "memory_total_gb": round(psutil.virtual_memory().total / (1024**3), 2),
+            **_static_system_info(),
             "disk_usage": {
-                "total_gb": round(psutil.disk_usage("/").total / (1024**3), 2),
-                "free_gb": round(psutil.disk_usage("/").free / (1024**3), 2),
-                "used_percent": psutil.disk_usage("/").percent,
+                "total_gb": round(disk.total / (1024**3), 2),
+                "free_gb": round(disk.free / (1024**3), 2),
+                "used_percent": disk.percent,
             },
         }
 
-        # Environment checks
-        environment_info = await check_environment()
-
-        # Database checks
-        database_info = await check_database()
-
-        # Dependency checks
-        dependency_info = await check_dependencies()
+        # The sub-checks are independent: run them together, alongside the
+        # 100 ms CPU sample, so the response waits only for the slowest
+        (
+            environment_info,
+            database_info,
+            dependency_info,
+            health_checks,
+            cpu_percent,
+        ) = await asyncio.gather(
+            check_environment(),
+            check_database(),
+            check_dependencies(),
+            perform_health_checks(),
+            asyncio.to_thread(psutil.cpu_percent, 0.1),
+        )
 
         # Performance metrics
         performance_info = {
-            "cpu_percent": psutil.cpu_percent(interval=0.1),
-            "memory_percent": psutil.virtual_memory().percent,
-            "memory_available_gb": round(
-                psutil.virtual_memory().available / (1024**3), 2
-            ),
+            "cpu_percent": cpu_percent,
+            "memory_percent": memory.percent,
+            "memory_available_gb": round(memory.available / (1024**3), 2),
             "load_average": os.getloadavg() if hasattr(os, "getloadavg") else None,
         }
 
-        # Health checks
-        health_checks = await perform_health_checks()
-
         # Determine overall status
         overall_status = "healthy"
         if any(check.get("status") == "error" for check in health_checks.values()):
@@ -225,7 +249,7 @@ async def detailed_health_check():
         return DetailedHealthResponse(
             status=overall_status,
             timestamp=datetime.utcnow().isoformat(),
-            uptime=str(uptime),
+            uptime=uptime,
             version="1.0.0",
             system=system_info,
             environment=environment_info,
@@ -242,6 +266,65 @@ async def detailed_health_check():
         )
 
 
+@lru_cache()
+def _static_system_info() -> Dict[str, Any]:
+    """System details that cannot change while the process is running."""
+    import psutil
+
+    return {
+        "platform": platform.platform(),
+        "architecture": platform.architecture()[0],
+        "processor": platform.processor(),
+        "python_version": sys.version,
+        "python_executable": sys.executable,
+        "cpu_count": psutil.cpu_count(),
+        "memory_total_gb": round(psutil.virtual_memory().total / (1024**3), 2),
+    }
+
+
+# Resolve node/npm on PATH once; a missing tool is then reported without
+# spawning anything, and an installed one is asked for its version only
+# on first use, since neither changes while the server runs
+_TOOL_PATHS: Dict[str, Optional[str]] = {
+    command: shutil.which(command) for command in ("node", "npm")
+}
+_tool_versions: Dict[str, str] = {}
+_tool_version_locks: Dict[str, asyncio.Lock] = {}
+
+
+def _run_version_command(executable: str) -> Optional[str]:
+    """Run ``executable --version`` and return its output, or None on failure."""
+    try:
+        result = subprocess.run(
+            [executable, "--version"], capture_output=True, text=True, timeout=5
+        )
+    except (subprocess.TimeoutExpired, OSError):
+        return None
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+async def _tool_version(command: str) -> Optional[str]:
+    """
+    Version reported by a command-line tool, or None if it is unavailable.
+
+    Only successful probes are cached, so a timeout or transient error is
+    retried on the next call. Concurrent first calls probe one at a time,
+    so callers waiting on a successful probe reuse its result.
+    """
+    executable = _TOOL_PATHS.get(command)
+    if executable is None:
+        return None
+    if command in _tool_versions:
+        return _tool_versions[command]
+    async with _tool_version_locks.setdefault(command, asyncio.Lock()):
+        if command not in _tool_versions:
+            version = await asyncio.to_thread(_run_version_command, executable)
+            if version is None:
+                return None
+            _tool_versions[command] = version
+        return _tool_versions[command]
+
+
 async def check_environment() -> Dict[str, Any]:
     """Check environment variables and configuration."""
     env_checks = {}
@@ -255,47 +338,29 @@ async def check_environment() -> Dict[str, Any]:
         "message": "Python 3.12+ recommended for best performance",
     }
 
-    # Node.js check
-    try:
-        node_result = subprocess.run(
-            ["node", "--version"], capture_output=True, text=True, timeout=5
-        )
-        if node_result.returncode == 0:
-            node_version = node_result.stdout.strip()
-            env_checks["nodejs"] = {
-                "status": "ok",
-                "version": node_version,
-                "message": "Node.js available",
-            }
-        else:
-            env_checks["nodejs"] = {
-                "status": "warning",
-                "message": "Node.js not found or not accessible",
-            }
-    except (subprocess.TimeoutExpired, FileNotFoundError):
+    # Node.js and npm checks run side by side
+    node_version, npm_version = await asyncio.gather(
+        _tool_version("node"), _tool_version("npm")
+    )
+    if node_version is not None:
+        env_checks["nodejs"] = {
+            "status": "ok",
+            "version": node_version,
+            "message": "Node.js available",
+        }
+    else:
         env_checks["nodejs"] = {
             "status": "warning",
             "message": "Node.js not found or not accessible",
         }
 
-    # npm check
-    try:
-        npm_result = subprocess.run(
-            ["npm", "--version"], capture_output=True, text=True, timeout=5
-        )
-        if npm_result.returncode == 0:
-            npm_version = npm_result.stdout.strip()
-            env_checks["npm"] = {
-                "status": "ok",
-                "version": npm_version,
-                "message": "npm available",
-            }
-        else:
-            env_checks["npm"] = {
-                "status": "warning",
-                "message": "npm not found or not accessible",
-            }
-    except (subprocess.TimeoutExpired, FileNotFoundError):
+    if npm_version is not None:
+        env_checks["npm"] = {
+            "status": "ok",
+            "version": npm_version,
+            "message": "npm available",
+        }
+    else:
         env_checks["npm"] = {
             "status": "warning",
             "message": "npm not found or not accessible",
@@ -315,8 +380,8 @@ async def check_environment() -> Dict[str, Any]:
     return env_checks
 
 
-async def check_database() -> Dict[str, Any]:
-    """Check database connectivity and status."""
+def _check_database_sync() -> Dict[str, Any]:
+    """Run the database checks; blocks on the database driver."""
     db_info = {}
 
     try:  # Check database connection
@@ -364,8 +429,16 @@ async def check_database() -> Dict[str, Any]:
     return db_info
 
 
-async def check_dependencies() -> Dict[str, Any]:
-    """Check critical dependencies."""
+async def check_database() -> Dict[str, Any]:
+    """Check database connectivity and status."""
+    # The session API is synchronous; run it in a worker thread so the
+    # event loop keeps serving other requests during database I/O
+    return await asyncio.to_thread(_check_database_sync)
+
+
+@lru_cache()
+def _dependency_info() -> Dict[str, Any]:
+    """Dependency versions; imported once, fixed for the process lifetime."""
     deps = {}
 
     # Check FastAPI
@@ -417,13 +490,15 @@ async def check_dependencies() -> Dict[str, Any]:
         deps["pydantic"] = {"status": "error", "message": "Pydantic not installed"}
 
     # Check psutil
-    try:
+    if PSUTIL_AVAILABLE:
+        import psutil
+
         deps["psutil"] = {
             "status": "ok",
             "version": psutil.__version__,
             "message": "psutil available for system monitoring",
         }
-    except ImportError:
+    else:
         deps["psutil"] = {
             "status": "warning",
             "message": "psutil not available - system monitoring limited",
@@ -432,6 +507,11 @@ async def check_dependencies() -> Dict[str, Any]:
     return deps
 
 
+async def check_dependencies() -> Dict[str, Any]:
+    """Check critical dependencies."""
+    return _dependency_info()
+
+
 async def perform_health_checks() -> Dict[str, Any]:
     """Perform comprehensive health checks."""
     checks = {}
@@ -448,12 +528,26 @@ async def perform_health_checks() -> Dict[str, Any]:
         ("config", project_root.parent / "config"),
     ]
 
+    # Most checked paths sit directly in project_root.parent, so one listing
+    # of it replaces a stat() per path
+    shared_parent = project_root.parent
+    try:
+        shared_parent_entries = {entry.name for entry in os.scandir(shared_parent)}
+    except OSError:
+        shared_parent_entries = set()
+
+    def path_exists(path: Path) -> bool:
+        if path.parent == shared_parent:
+            return path.name in shared_parent_entries
+        return path.exists()
+
     for name, path in important_dirs:
+        exists = path_exists(path)
         checks[f"directory_{name}"] = {
-            "status": "ok" if path.exists() else "warning",
+            "status": "ok" if exists else "warning",
             "path": str(path),
-            "exists": path.exists(),
-            "message": f"Directory {name} {'exists' if path.exists() else 'does not exist'}",
+            "exists": exists,
+            "message": f"Directory {name} {'exists' if exists else 'does not exist'}",
         }
 
     # Check critical files
@@ -464,14 +558,17 @@ async def perform_health_checks() -> Dict[str, Any]:
     ]
 
     for name, file_path in critical_files:
+        exists = path_exists(file_path)
         checks[f"file_{name}"] = {
-            "status": "ok" if file_path.exists() else "warning",
+            "status": "ok" if exists else "warning",
             "path": str(file_path),
-            "exists": file_path.exists(),
-            "message": f"File {name} {'exists' if file_path.exists() else 'does not exist'}",
+            "exists": exists,
+            "message": f"File {name} {'exists' if exists else 'does not exist'}",
         }
 
     # Memory usage check
+    import psutil
+
     memory = psutil.virtual_memory()
     checks["memory_usage"] = {
         "status": (
@@ -1,11 +1,31 @@
 # AI Base Project v1 - Database Models
 # SQLAlchemy models for the application
 
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, Float
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    JSON,
+    SmallInteger,
+    String,
+    Text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 
 from ..core.database import Base
 
+# 64-bit ids for the append-only log tables; SQLite only auto-increments an
+# INTEGER PRIMARY KEY (and its INTEGER is already 64-bit), so keep that there
+BigIntegerId = BigInteger().with_variant(Integer, "sqlite")
+
+# Structured columns take dicts/lists directly; stored as JSONB on PostgreSQL
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
+
 
 class HealthCheck(Base):
     """
@@ -15,14 +35,19 @@ class HealthCheck(Base):
     """
 
     __tablename__ = "health_checks"
+    __table_args__ = (
+        # Latest results per check type / per status
+        Index("ix_health_checks_check_type_timestamp", "check_type", "timestamp"),
+        Index("ix_health_checks_status_timestamp", "status", "timestamp"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BigIntegerId, primary_key=True, index=True)
     timestamp = Column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True), server_default=func.now(), nullable=False, index=True
     )
     status = Column(String(50), nullable=False)  # healthy, degraded, unhealthy
     check_type = Column(String(100), nullable=False)  # database, system, dependencies
-    details = Column(Text, nullable=True)  # JSON string with detailed results
+    details = Column(JSONDocument, nullable=True)  # Detailed results
     response_time_ms = Column(Float, nullable=True)  # Response time in milliseconds
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -42,9 +67,9 @@ class SystemMetrics(Base):
 
     __tablename__ = "system_metrics"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BigIntegerId, primary_key=True, index=True)
     timestamp = Column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True), server_default=func.now(), nullable=False, index=True
     )
 
     # CPU metrics
@@ -81,20 +106,25 @@ class ApiLog(Base):
     """
 
     __tablename__ = "api_logs"
+    __table_args__ = (
+        # Per-endpoint and per-status-code history
+        Index("ix_api_logs_method_path_timestamp", "method", "path", "timestamp"),
+        Index("ix_api_logs_status_code_timestamp", "status_code", "timestamp"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BigIntegerId, primary_key=True, index=True)
     timestamp = Column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True), server_default=func.now(), nullable=False, index=True
     )
 
     # Request information
     method = Column(String(10), nullable=False)  # GET, POST, PUT, DELETE
     path = Column(String(500), nullable=False)
-    query_params = Column(Text, nullable=True)
-    headers = Column(Text, nullable=True)  # JSON string
+    query_params = Column(JSONDocument, nullable=True)
+    headers = Column(JSONDocument, nullable=True)
 
     # Response information
-    status_code = Column(Integer, nullable=False)
+    status_code = Column(SmallInteger, nullable=False)
     response_time_ms = Column(Float, nullable=True)
     response_size_bytes = Column(Integer, nullable=True)
 
@@ -129,7 +159,7 @@ class Configuration(Base):
     )  # string, integer, float, boolean, json
     is_sensitive = Column(Boolean, default=False)  # Hide from logs/API responses
     is_readonly = Column(Boolean, default=False)  # Prevent modifications
-    category = Column(String(100), nullable=True)  # Group related settings
+    category = Column(String(100), nullable=True, index=True)  # Group related settings
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -3,6 +3,8 @@ AI Base Project v1 - Simple Health Check Test
 Tests the health check endpoints without requiring all dependencies
 """
 
+import asyncio
+import importlib.util
 import subprocess
 import sys
 import time
@@ -12,9 +14,9 @@ import json
 def check_server_running():
     """Check if the FastAPI server is running."""
     try:
-        import requests
+        import httpx
 
-        response = requests.get("http://localhost:8000/api/v1/health", timeout=5)
+        response = httpx.get("http://localhost:8000/api/v1/health", timeout=5)
         return response.status_code == 200
     except:
         return False
@@ -23,7 +25,7 @@ def check_server_running():
 def test_health_endpoints():
     """Test all health check endpoints."""
     try:
-        import requests
+        import httpx
 
         endpoints = [
             ("/api/v1/health", "Basic Health Check"),
@@ -36,9 +38,26 @@ def test_health_endpoints():
         print("🔍 Testing Health Check Endpoints")
         print("-" * 40)
 
-        for endpoint, description in endpoints:
+        # The endpoints are independent: request them all at once, then
+        # report in the listed order
+        async def fetch_all():
+            async with httpx.AsyncClient(
+                base_url="http://localhost:8000", timeout=10
+            ) as client:
+                return await asyncio.gather(
+                    *(client.get(endpoint) for endpoint, _ in endpoints),
+                    return_exceptions=True,
+                )
+
+        responses = asyncio.run(fetch_all())
+        results = [
+            (None, r) if isinstance(r, Exception) else (r, None) for r in responses
+        ]
+
+        for (endpoint, description), (response, error) in zip(endpoints, results):
             try:
-                response = requests.get(f"http://localhost:8000{endpoint}", timeout=10)
+                if error is not None:
+                    raise error
                 status = (
                     "✅ PASS"
                     if response.status_code == 200
@@ -64,13 +83,18 @@ def test_health_endpoints():
         return True
 
     except ImportError:
-        print("❌ requests library not available for testing")
-        print("Install with: pip install requests")
+        print("❌ httpx library not available for testing")
+        print("Install with: pip install httpx")
         return False
 
 
 def test_basic_import():
-    """Test if we can import our modules."""
+    """
+    Test if our modules are installed.
+
+    Only checks that each module can be found; importing them all would
+    pull in FastAPI, SQLAlchemy and friends just to print a checklist.
+    """
     print("🔍 Testing Module Imports")
     print("-" * 40)
 
@@ -80,14 +104,13 @@ def test_basic_import():
         ("sqlalchemy", "Database ORM"),
         ("pydantic", "Data validation"),
         ("psutil", "System monitoring"),
-        ("requests", "HTTP client for testing"),
+        ("httpx", "HTTP client for testing"),
     ]
 
     for module_name, description in modules:
-        try:
-            __import__(module_name)
+        if importlib.util.find_spec(module_name) is not None:
             print(f"✅ {module_name} - {description}")
-        except ImportError:
+        else:
             print(f"❌ {module_name} - {description} (not installed)")
 
     print()